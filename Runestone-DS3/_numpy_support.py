@@ -0,0 +1,8 @@
+"""
+NumPy is optional: the batch functions only switch to their vectorised paths when they're handed a
+NumPy array, and only import NumPy at that point.
+"""
+
+
+def is_numpy_array(values):
+    return type(values).__module__ == "numpy" and hasattr(values, "dtype")
@@ -0,0 +1,187 @@
+"""
+One place for converting integers to and from any base between 2 and 36.
+
+decimal_base_converter (chapter 3), convert_base and to_str (chapter 4) all peel off ONE digit at a
+time with n % base, n // base. On a big int every one of those divisions costs O(d) for d digits,
+so the whole conversion is O(d^2) - plus the string concatenation on top.
+
+Here big numbers are handled with DIVIDE AND CONQUER instead: split n around base^k (with k about
+half the digits) using one divmod, convert the high and low halves separately, and zero-pad the low
+half to exactly k digits. The powers base^k, base^2k, base^4k... are computed once per base and
+reused. Parsing strings works the same way in reverse: value = high * base^k + low.
+
+Bases 2, 8 and 16 skip all of that and use Python's own bin/oct/hex formatting, which runs in C.
+to_base_many/from_base_many convert whole lists, or NumPy integer arrays with one vectorised
+operation per digit position.
+"""
+
+from functools import lru_cache
+
+from _numpy_support import is_numpy_array
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+SMALL_DIGITS = 40  # Below about this many digits, the simple loop beats splitting
+_FORMAT_SPEC = {2: "b", 8: "o", 16: "X"}
+
+
+def _check_base(base):
+    if not 2 <= base <= 36:
+        raise ValueError(f"Base must be between 2 and 36, not {base}.")
+
+
+@lru_cache(maxsize=128)
+def _power(base, k):
+    return base ** k
+
+
+def _to_base_small(n, base):
+    if base == 10:
+        return str(n)  # Small enough to stay under Python's int -> str digit limit
+    digits = []
+    while n:
+        n, rem = divmod(n, base)
+        digits.append(DIGITS[rem])
+    return "".join(reversed(digits))
+
+
+def _to_base_split(n, base, k, width):
+    # n has at most 2k digits. width is the zero-padded length wanted (0 for no padding).
+    if k <= SMALL_DIGITS:
+        return _to_base_small(n, base).rjust(width, "0")
+    high, low = divmod(n, _power(base, k))
+    half = k // 2
+    low_digits = _to_base_split(low, base, half, k)
+    if not high and not width:
+        return low_digits.lstrip("0")
+    return _to_base_split(high, base, half, max(width - k, 0)) + low_digits
+
+
+def to_base(n, base):
+    _check_base(base)
+    if n < 0:
+        return "-" + to_base(-n, base)
+    if n == 0:
+        return "0"
+    if base in _FORMAT_SPEC:
+        return format(n, _FORMAT_SPEC[base])
+
+    # Keep the split point at SMALL_DIGITS * 2^j, so every level of the recursion halves it and
+    # reuses the same cached powers.
+    k = SMALL_DIGITS
+    while _power(base, 2 * k) <= n:
+        k *= 2
+    return _to_base_split(n, base, k, 0)
+
+
+def _from_base_split(digits, base):
+    if len(digits) <= SMALL_DIGITS * 16:
+        return int(digits, base)
+    k = len(digits) // 2
+    return _from_base_split(digits[:-k], base) * _power(base, k) + _from_base_split(digits[-k:], base)
+
+
+def _check_digits(digits, base):
+    # int() on its own would also take '_' separators, 0x/0b prefixes and non-ASCII digits.
+    if not digits:
+        raise ValueError("No digits to convert.")
+    if not digits.isascii() or digits.upper().strip(DIGITS[:base]):
+        raise ValueError(f"{digits!r} isn't a base {base} number.")
+
+
+def from_base(digits, base):
+    _check_base(base)
+    digits = digits.strip()
+    sign = -1 if digits.startswith("-") else 1
+    digits = digits[1:] if sign < 0 else digits
+    _check_digits(digits, base)
+    if base in _FORMAT_SPEC or base == 32 or base == 4:
+        return sign * int(digits, base)  # Power-of-two bases have no length limit in int()
+    return sign * _from_base_split(digits, base)
+
+
+def to_base_many(values, base):
+    # A list of strings for a list, or a NumPy array of strings for a NumPy integer array.
+    _check_base(base)
+    if not is_numpy_array(values):
+        return [to_base(value, base) for value in values]
+
+    import numpy as np
+
+    values = np.asarray(values)
+    if values.dtype.kind not in "iu":
+        raise ValueError(f"Expected an integer array, not {values.dtype}.")
+    negative = values < 0
+    remaining = np.abs(values).astype(np.uint64)  # abs(-2^63) wraps to itself, which uint64 reads correctly
+    biggest = int(remaining.max()) if remaining.size else 0
+    width = max(len(to_base(biggest, base)), 1)
+
+    # One column of digits per position, filled right to left for every value at once.
+    digits = np.zeros((remaining.size, width), dtype=np.uint8)
+    for col in range(width - 1, -1, -1):
+        digits[:, col] = remaining % base
+        remaining //= base
+    table = np.frombuffer(DIGITS.encode(), dtype=np.uint8)
+    text = table[digits].view(f"S{width}").ravel()
+
+    stripped = np.char.lstrip(text, b"0")
+    stripped[stripped == b""] = b"0"
+    result = stripped.astype(str)
+    return np.where(negative, np.char.add("-", result), result)
+
+
+def from_base_many(values, base):
+    # A list of ints for a list, or a NumPy int64 array for a NumPy array of strings.
+    _check_base(base)
+    if not is_numpy_array(values):
+        return [from_base(value, base) for value in values]
+
+    import numpy as np
+
+    text = np.char.strip(np.asarray(values, dtype=str))
+    negative = np.char.startswith(text, "-")
+    text = np.where(negative, np.char.replace(text, "-", "", count=1), text)  # Only the one leading '-'
+    if (np.char.str_len(text) == 0).any():
+        raise ValueError("No digits to convert.")
+    text = np.char.lstrip(text, "0")
+    lengths = np.char.str_len(text)
+    width = int(lengths.max()) if text.size else 0
+    safe = 1  # Numbers with at most this many digits can't overflow an int64
+    while base ** (safe + 1) <= 2**63:
+        safe += 1
+    if width > safe + 1:
+        raise ValueError(f"{width} base {base} digits is too long for an int64 - use from_base on a list.")
+    if width == 0:
+        return np.zeros(len(text), dtype=np.int64)  # Nothing but zeros
+    try:
+        padded = np.char.rjust(text, width, "0").astype(f"S{width}")
+    except UnicodeEncodeError:
+        raise ValueError(f"Found a character that isn't a base {base} digit.") from None
+    chars = padded.view(np.uint8).reshape(-1, width)
+
+    lookup = np.full(256, 255, dtype=np.uint8)
+    lookup[np.frombuffer(DIGITS[:base].encode(), dtype=np.uint8)] = np.arange(base)
+    lookup[np.frombuffer(DIGITS[:base].lower().encode(), dtype=np.uint8)] = np.arange(base)
+    digits = lookup[chars]
+    if (digits == 255).any():
+        raise ValueError(f"Found a character that isn't a base {base} digit.")
+
+    result = np.zeros(len(text), dtype=np.int64)
+    for col in range(width):
+        result = result * base + digits[:, col]  # Rows longer than `safe` may wrap - redone below
+    result = np.where(negative, -result, result)
+
+    for row in np.flatnonzero(lengths > safe):
+        value = from_base(str(text[row]), base)
+        value = -value if negative[row] else value
+        if not -2**63 <= value < 2**63:
+            raise ValueError(f"{str(values[row])!r} doesn't fit in an int64 - use from_base on a list.")
+        result[row] = value
+    return result
+
+
+if __name__ == "__main__":
+    print(to_base(233, 2), to_base(1453, 16), to_base(-35, 36))
+    print(from_base("11101001", 2), from_base("5AD", 16), from_base("-Z", 36))
+    big = 7 ** 5000
+    print(from_base(to_base(big, 10), 10) == big, from_base(to_base(big, 7), 7) == big)
+    print(to_base_many([10, 255], 16))
@@ -0,0 +1,492 @@
+"""
+Timing comparisons between the original chapter implementations and the faster versions.
+
+Run everything with `python benchmarks.py`, or pick some with e.g. `python benchmarks.py queue`.
+The chapter files print their demos when imported, so that output is swallowed here.
+"""
+
+import contextlib
+import io
+import os
+import queue
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import chapter3
+
+import base_conversion
+import coin_change
+import palindromes
+import stack_safe
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def _chapter4():
+    # chapter 4 imports turtle and pythonds3, so it's only pulled in by the benchmarks that use it.
+    with contextlib.redirect_stdout(io.StringIO()):
+        import chapter4
+    return chapter4
+
+
+def report(title, results):
+    print(f"\n{title}")
+    width = max(len(name) for name, _ in results)
+    for name, secs in results:
+        print(f"  {name:<{width}}  {secs:8.4f}s")
+
+
+def bench_queue(n=100_000):
+    def run(queue):
+        for i in range(n):
+            queue.enqueue(i)
+        while not queue.is_empty():
+            queue.dequeue()
+
+    report(f"Queue: {n} enqueues then {n} dequeues", [
+        ("Queue (list insert)", timed(run, chapter3.Queue())),
+        ("RingQueue", timed(run, chapter3.RingQueue())),
+    ])
+
+
+def traced_bytes(build):
+    tracemalloc.start()
+    try:
+        kept = build()  # Keep the structure alive while measuring
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return current
+
+
+def traced_peak(fn, *args):
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        fn(*args)
+        secs = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return secs, peak
+
+
+def bench_node_memory(n=100_000):
+    structures = [
+        (chapter3.LinkedList, "add"),
+        (chapter3.SortedList, "add"),
+        (chapter3.NodeQueue, "enqueue"),
+        (chapter3.DoublyLinkedList, "append"),
+    ]
+    print(f"\nBytes per node, value included ({n} nodes, tracemalloc)")
+    for cls, method in structures:
+        row = []
+        for compact in (False, True):
+            def build():
+                structure = cls(compact=compact)
+                add = getattr(structure, method)
+                # SortedList.add walks the list, so feed it descending keys to keep it O(1) per add.
+                for i in range(n, 0, -1):
+                    add(i)
+                return structure
+            row.append(traced_bytes(build) / n)
+        print(f"  {cls.__name__:<16}  Node: {row[0]:6.1f}  SlotNode: {row[1]:6.1f}")
+
+
+def bench_array_list(n=1_000_000):
+    def build(structure):
+        def fill():
+            for i in range(n):
+                structure.add(i)
+            return structure
+        return fill
+
+    results = []
+    for name, make in [
+        ("LinkedList", chapter3.LinkedList),
+        ("LinkedList(compact=True)", lambda: chapter3.LinkedList(compact=True)),
+        ("ArrayLinkedList", chapter3.ArrayLinkedList),
+    ]:
+        start = time.perf_counter()
+        per_item = traced_bytes(build(make())) / n
+        results.append((name, per_item, time.perf_counter() - start))
+
+    print(f"\nLinkedList engines: {n} adds")
+    for name, per_item, secs in results:
+        print(f"  {name:<24}  {per_item:6.1f} bytes/item  {secs:7.3f}s")
+
+
+def bench_sorted_list(n=5_000):
+    keys = random.sample(range(n * 10), n)
+
+    def run(sorted_list):
+        for key in keys:
+            sorted_list.add(key)
+        for key in keys:
+            sorted_list.search(key)
+        for key in keys:
+            sorted_list.remove(key)
+
+    report(f"SortedList: {n} random adds, searches and removes", [
+        ("SortedList", timed(run, chapter3.SortedList())),
+        ("SkipSortedList", timed(run, chapter3.SkipSortedList())),
+    ])
+
+
+def bench_bulk_load(sizes=(10**5, 10**6), quadratic_limit=5_000):
+    one_at_a_time = [
+        (chapter3.LinkedList, "append"),
+        (chapter3.SortedList, "add"),
+        (chapter3.DoublyLinkedList, "append"),
+        (chapter3.NodeQueue, "enqueue"),
+    ]
+    for n in sizes:
+        keys = random.sample(range(n * 10), n)
+        results = []
+        for cls, method in one_at_a_time:
+            def one_by_one(keys):
+                add = getattr(cls(), method)
+                for key in keys:
+                    add(key)
+
+            name = f"{cls.__name__}.{method}"
+            if cls is chapter3.SortedList and n > quadratic_limit:
+                # O(n^2) with random keys, so only time a prefix.
+                results.append((f"{name} (first {quadratic_limit} only)", timed(one_by_one, keys[:quadratic_limit])))
+            else:
+                results.append((name, timed(one_by_one, keys)))
+            results.append((f"{cls.__name__}.from_iterable", timed(cls.from_iterable, keys)))
+        report(f"Bulk loading {n} items", results)
+
+
+def bench_concurrent_queue(n=200_000, producers=4, consumers=4, maxsize=1000, batch=64):
+    per_producer = n // producers
+    done = object()
+
+    def run(put, get_batch):
+        def produce():
+            for i in range(per_producer):
+                put(i)
+
+        def consume():
+            while True:
+                stops = sum(item is done for item in get_batch())
+                if stops:
+                    # A batch can grab several consumers' stop markers - hand the extras back.
+                    for _ in range(stops - 1):
+                        put(done)
+                    return
+
+        threads = [threading.Thread(target=produce) for _ in range(producers)]
+        readers = [threading.Thread(target=consume) for _ in range(consumers)]
+        for thread in threads + readers:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for _ in readers:
+            put(done)
+        for thread in readers:
+            thread.join()
+
+    stdlib = queue.Queue(maxsize)
+    single = chapter3.ConcurrentNodeQueue(maxsize=maxsize)
+    batched = chapter3.ConcurrentNodeQueue(maxsize=maxsize)
+    report(f"{producers} producers / {consumers} consumers, {n} items, maxsize {maxsize}", [
+        ("queue.Queue", timed(run, stdlib.put, lambda: (stdlib.get(),))),
+        ("ConcurrentNodeQueue.dequeue", timed(run, single.enqueue, lambda: (single.dequeue(),))),
+        (f"ConcurrentNodeQueue.dequeue_many({batch})", timed(run, batched.enqueue, lambda: batched.dequeue_many(batch))),
+    ])
+
+
+def bench_expressions(n=100_000, formula="price * (1 + tax) ^ years - fee / 2"):
+    bindings = [{"price": i, "tax": 0.05, "years": 3, "fee": 10} for i in range(n)]
+
+    def reparse():
+        for values in bindings:
+            chapter3.postfix_eval(chapter3.infix_to_postfix(formula), values)
+
+    def compiled():
+        for values in bindings:
+            chapter3.compile_expression(formula).evaluate(values)
+
+    report(f"Evaluating one formula with {n} different bindings", [
+        ("infix_to_postfix + postfix_eval", timed(reparse)),
+        ("compile_expression(...).evaluate", timed(compiled)),
+    ])
+    print(f"  {chapter3.compile_expression.cache_info()}")
+
+
+def bench_columns(rows=10**6, sample=100_000, formula="price * (1 + tax) ^ years - fee / 2"):
+    import numpy as np
+
+    columns = {
+        "price": np.random.rand(rows) * 100,
+        "tax": np.full(rows, 0.05),
+        "years": np.random.randint(1, 10, rows),
+        "fee": np.random.rand(rows),
+    }
+    expression = chapter3.compile_expression(formula)
+
+    def row_at_a_time():
+        names = expression.variables
+        for i in range(sample):
+            expression.evaluate({name: columns[name][i].item() for name in names})
+
+    per_row = timed(row_at_a_time) / sample
+    report(f"Evaluating {formula!r} over {rows} rows", [
+        (f"evaluate per row (extrapolated from {sample})", per_row * rows),
+        ("evaluate_columns", timed(expression.evaluate_columns, columns)),
+        ("evaluate_columns(chunk_size=65536)", timed(expression.evaluate_columns, columns, 65536)),
+    ])
+
+
+def bench_base_conversion(base=7, sizes=((100, 2000), (1000, 200), (10_000, 5)), batch=100_000):
+    chapter4 = _chapter4()
+
+    converters = [
+        ("chapter3.decimal_base_converter", chapter3.decimal_base_converter),
+        ("chapter4.convert_base", chapter4.convert_base),
+        ("chapter4.to_str", chapter4.to_str),
+        ("base_conversion.to_base", base_conversion.to_base),
+    ]
+    for digits, count in sizes:
+        numbers = [random.randrange(base ** (digits - 1), base ** digits) for _ in range(count)]
+
+        def run(convert):
+            for n in numbers:
+                convert(n, base)
+
+        results, failed = [], []
+        for name, convert in converters:
+            try:
+                results.append((name, timed(run, convert)))
+            except RecursionError:
+                failed.append(name)
+        report(f"Base {base}: {count} numbers with {digits} digits", results)
+        for name in failed:
+            print(f"  {name} hit the recursion limit")
+
+    import numpy as np
+
+    values = np.random.randint(0, 2**62, batch)
+    as_list = values.tolist()
+    strings = base_conversion.to_base_many(values, base)
+    report(f"Base {base}: batches of {batch} int64 values", [
+        ("to_base_many(list)", timed(base_conversion.to_base_many, as_list, base)),
+        ("to_base_many(ndarray)", timed(base_conversion.to_base_many, values, base)),
+        ("from_base_many(list)", timed(base_conversion.from_base_many, strings.tolist(), base)),
+        ("from_base_many(ndarray)", timed(base_conversion.from_base_many, strings, base)),
+    ])
+
+
+def bench_josephus(simulated=20_000, n=10**7, ordered=10**6, k=3):
+    def simulate():
+        with contextlib.redirect_stdout(io.StringIO()):
+            chapter3.josephus(simulated, k)
+
+    report(f"Josephus, k = {k}", [
+        (f"josephus simulation (n = {simulated})", timed(simulate)),
+        (f"O(n) recurrence (n = {n})", timed(chapter3._josephus_linear, n, k, 2)),
+        (f"josephus_survivors, O(k log n) (n = {n})", timed(chapter3.josephus_survivors, n, k)),
+        (f"josephus_order, Fenwick tree (n = {ordered})", timed(chapter3.josephus_order, ordered, k)),
+    ])
+
+
+def bench_palindromes(short=900, long=10**5, batch=10**6):
+    chapter4 = _chapter4()
+
+    def make(length):
+        half = "".join(random.choice("abcde ") for _ in range(length // 2))
+        return half + half[::-1]
+
+    for length in (short, long):
+        text = make(length)
+        results = [
+            ("chapter3.palindrome_checker", timed(chapter3.palindrome_checker, text)),
+            ("chapter3.palindrome_checker_spaces", timed(chapter3.palindrome_checker_spaces, text)),
+        ]
+        if length < sys.getrecursionlimit():
+            results.append(("chapter4.is_pal(remove_white(...))", timed(lambda: chapter4.is_pal(chapter4.remove_white(text)))))
+        results += [
+            ("is_palindrome", timed(palindromes.is_palindrome, text)),
+            ("is_palindrome(alpha_only=True)", timed(palindromes.is_palindrome, text, False, True)),
+            ("longest_palindrome", timed(palindromes.longest_palindrome, text)),
+        ]
+        report(f"One palindrome of length {length}", results)
+
+    texts = [make(random.randint(2, 20)) for _ in range(batch)]  # All palindromes, so nothing exits early
+    report(f"Batch of {batch} short palindromes, ignore_case + alpha_only", [
+        ("is_palindrome per string", timed(lambda: [palindromes.is_palindrome(t, True, True) for t in texts])),
+        ("are_palindromes", timed(palindromes.are_palindromes, texts, True, True)),
+    ])
+
+
+def bench_stack_safe(n=10**6, recursive_n=900):
+    chapter4 = _chapter4()
+
+    numbers = list(range(n))
+    text = "a" * n  # A palindrome, so is_pal has to look at every character
+
+    @stack_safe.trampoline
+    def trampolined_sum(num_list, i=0):
+        if i == len(num_list):
+            return 0
+        return num_list[i] + (yield trampolined_sum.defer(num_list, i + 1))
+
+    helpers = ["list_sum_rec", "reverse_str", "reversal_recursive", "is_pal", "factorial_recursive"]
+    arguments = [numbers, text, numbers, text, n]
+    report(f"chapter4 recursive helpers (n = {recursive_n}, the recursion limit is {sys.getrecursionlimit()})", [
+        (name, timed(getattr(chapter4, name), arg[:recursive_n] if name != "factorial_recursive" else recursive_n))
+        for name, arg in zip(helpers, arguments)
+    ])
+    report(f"stack_safe equivalents (n = {n})", [
+        (name, timed(getattr(stack_safe, name), arg)) for name, arg in zip(helpers, arguments)
+    ] + [("trampolined non-tail list sum", timed(trampolined_sum, numbers))])
+
+
+def bench_coin_change(queries=10**5, sample=1_000, largest=500, coins=(1, 5, 10, 25)):
+    chapter4 = _chapter4()
+
+    import numpy as np
+
+    targets = [random.randrange(largest) for _ in range(queries)]
+
+    def memoized():
+        # make_change_2 needs a fresh table per call, and recurses once per unit of change.
+        for change in targets[:sample]:
+            chapter4.make_change_2(coins, change, [0] * (change + 1))
+
+    def per_query(method):
+        solver = coin_change.CoinChange(coins)
+        method = getattr(solver, method)
+        for change in targets:
+            method(change)
+
+    solver = coin_change.CoinChange(coins, largest)
+    report(f"{queries} change queries below {largest} with coins {coins}", [
+        (f"chapter4.make_change_2 (extrapolated from {sample})", timed(memoized) * queries / sample),
+        ("CoinChange.fewest_coins per query", timed(per_query, "fewest_coins")),
+        ("CoinChange.make_change per query", timed(per_query, "make_change")),
+        ("CoinChange.count_ways per query", timed(per_query, "count_ways")),
+        ("fewest_coins_many(ndarray), warm table", timed(solver.fewest_coins_many, np.array(targets))),
+    ])
+
+    big = 10**6
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.bin")
+        start = time.perf_counter()
+        solver = coin_change.CoinChange(coins, big)
+        built = time.perf_counter() - start
+        saved = timed(solver.save, path)
+        start = time.perf_counter()
+        loaded = coin_change.CoinChange.load(path)
+        loaded.make_change(big)
+        reloaded = time.perf_counter() - start
+        grown = timed(loaded.fewest_coins, big + 1)  # Copies the mapped table into memory first
+        report(f"Keeping a table for amounts up to {big}", [
+            ("build from scratch", built),
+            ("save", saved),
+            ("load (memory-mapped) + first query", reloaded),
+            ("extend the loaded table by one", grown),
+        ])
+
+
+def bench_knapsack(item_counts=(10, 100, 1000), capacities=(10**3, 10**5, 10**7), python_limit=2 * 10**6):
+    chapter4 = _chapter4()
+
+    import knapsack
+
+    print(f"\n0/1 knapsack, seconds per solve (pure Python skipped past n*W = {python_limit})")
+    print(f"  {'n':>6} {'W':>10}  {'chapter4 efficient':>18}  {'NumPy int64':>12}  {'NumPy float':>12}")
+    for n in item_counts:
+        for capacity in capacities:
+            items = [(random.randint(1, capacity // 10), random.randint(1, 1000)) for _ in range(n)]
+            float_items = [(weight, value + 0.5) for weight, value in items]
+            python = "skipped"
+            if n * capacity <= python_limit:
+                python = f"{timed(chapter4.o1_knapsack_tabulation_efficient, capacity, items):.4f}"
+            vectorised = timed(knapsack.o1_knapsack, capacity, items)
+            floats = timed(knapsack.o1_knapsack, capacity, float_items)
+            print(f"  {n:>6} {capacity:>10}  {python:>18}  {vectorised:12.4f}  {floats:12.4f}")
+
+
+def bench_knapsack_items(n=200, capacity=10**4, big_n=1000, big_capacity=10**6):
+    chapter4 = _chapter4()
+
+    import knapsack
+
+    def compare(title, items, capacity, runs):
+        print(f"\n{title}")
+        for name, fn, args in runs:
+            secs, peak = traced_peak(fn, capacity, items, *args)
+            print(f"  {name:<44}  {secs:8.4f}s  peak {peak / 2**20:8.1f} MiB")
+
+    items = [(random.randint(1, capacity // 10), random.randint(1, 1000)) for _ in range(n)]
+    compare(f"0/1 knapsack with the chosen items, n = {n}, W = {capacity}", items, capacity, [
+        ("chapter4.o1_knapsack_tabulation (value only)", chapter4.o1_knapsack_tabulation, ()),
+        ("o1_knapsack_items, decision bits", knapsack.o1_knapsack_items, ()),
+        ("o1_knapsack_items, Hirschberg splits", knapsack.o1_knapsack_items, (None, 2**14)),
+    ])
+
+    items = [(random.randint(1, big_capacity // 10), random.randint(1, 1000)) for _ in range(big_n)]
+    compare(f"0/1 knapsack with the chosen items, n = {big_n}, W = {big_capacity}", items, big_capacity, [
+        ("o1_knapsack (value only)", knapsack.o1_knapsack, ()),
+        ("o1_knapsack_items, decision bits", knapsack.o1_knapsack_items, ()),
+        ("o1_knapsack_items, 16 MiB of bits at most", knapsack.o1_knapsack_items, (None, 2**24)),
+    ])
+
+
+def bench_knapsack_variants(n=100, capacity=10**5, quantity=1000, mitm_n=40):
+    import knapsack
+
+    bounded = [(random.randint(1, capacity // 100), random.randint(1, 1000), quantity) for _ in range(n)]
+    one_by_one = [(weight, value) for weight, value, count in bounded for _ in range(min(count, capacity // weight))]
+    unlimited = [(weight, value) for weight, value, _ in bounded]
+    report(f"Bounded / unbounded knapsack, {n} items, W = {capacity}, quantity {quantity}", [
+        (f"o1_knapsack over every copy ({len(one_by_one)} items)", timed(knapsack.o1_knapsack, capacity, one_by_one)),
+        ("bounded_knapsack (binary splitting)", timed(knapsack.bounded_knapsack, capacity, bounded)),
+        ("unbounded_knapsack", timed(knapsack.unbounded_knapsack, capacity, unlimited)),
+        ("knapsack_2d, V = 1000", timed(knapsack.knapsack_2d, capacity // 100, 1000,
+                                        [(w // 100, random.randint(1, 100), v) for w, v, _ in bounded])),
+    ])
+
+    huge = 10**12
+    items = [(random.randint(huge // 40, huge // 10), random.randint(1, 10**6)) for _ in range(mitm_n)]
+    report(f"{mitm_n} items, W = {huge} (no table could fit)", [
+        ("o1_knapsack_mitm", timed(knapsack.o1_knapsack_mitm, huge, items)),
+        ("knapsack (picks meet in the middle)", timed(knapsack.knapsack, huge, items)),
+    ])
+
+
+BENCHMARKS = {
+    "queue": bench_queue,
+    "memory": bench_node_memory,
+    "arraylist": bench_array_list,
+    "sortedlist": bench_sorted_list,
+    "bulk": bench_bulk_load,
+    "concurrent": bench_concurrent_queue,
+    "expressions": bench_expressions,
+    "columns": bench_columns,
+    "baseconversion": bench_base_conversion,
+    "josephus": bench_josephus,
+    "palindromes": bench_palindromes,
+    "stacksafe": bench_stack_safe,
+    "coinchange": bench_coin_change,
+    "knapsack": bench_knapsack,
+    "knapsackitems": bench_knapsack_items,
+    "knapsackvariants": bench_knapsack_variants,
+}
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
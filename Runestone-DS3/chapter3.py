@@ -74,31 +74,52 @@ print(s.pop())
 print(s.size())
 
 
+"""
+A few problems with the first version of balance_checker: [Stack()]*3 doesn't make three stacks,
+it makes three references to the SAME stack (so it was really one stack all along), and every
+character got compared against three lists in a nested loop.
+
+One stack is all you need anyway - push each opening bracket, and each closing bracket must match
+whatever is on top. A dict from closing to opening bracket does the match in O(1).
+
+The rewrite also takes the input as an iterable of CHUNKS (e.g. a file read 1MB at a time), so
+the text never has to be in memory all at once - the only thing that grows is the stack, i.e.
+the nesting depth. A compiled regex jumps straight from bracket to bracket, skipping everything
+else at C speed. find_imbalance() says WHERE it went wrong: the offset of a stray closing bracket,
+or of the innermost opening bracket that never got closed.
+"""
+
+import re
+
+CLOSING_TO_OPENING = {")": "(", "]": "[", "}": "{"}
+BRACKET_RE = re.compile(r"[()\[\]{}]")
+
+def find_imbalance(chunks):
+    # chunks is a string or an iterable of strings. Returns None if balanced, else an offset.
+    if isinstance(chunks, str):
+        chunks = (chunks,)
+    opened = Stack()  # (bracket, offset) of every unclosed opening bracket
+    base = 0
+    for chunk in chunks:
+        for match in BRACKET_RE.finditer(chunk):
+            char = match.group()
+            opening = CLOSING_TO_OPENING.get(char)
+            if opening is None:
+                opened.push((char, base + match.start()))
+            elif opened.is_empty() or opened.pop()[0] != opening:
+                return base + match.start()
+        base += len(chunk)
+    return None if opened.is_empty() else opened.peek()[1]
+
 def balance_checker(par_str):
-    open_pars = ["(","{","["]
-    closed_pars = [")","}","]"]
-    par_stacks = [Stack()]*3
-    # Inefficient with space. You don't need the 3 stacks. But time complexity is good.
-
-    for char in par_str:
-        for i in range(3):
-            if char == open_pars[i]:
-                par_stacks[i].push(char)
-            elif char == closed_pars[i]:
-                if par_stacks[i].is_empty():
-                    return False
-                par_stacks[i].pop()
-    
-    for par_check in par_stacks:
-        if not par_check.is_empty():
-            return False
-    return True
+    return find_imbalance(par_str) is None
 
 print(balance_checker('(([{[[({({{adas(sd([{[adf({[{[afgdsg[{({})s]dfgs)]sdfg}sdfg)s]dfg}sdf)gsd}fg}sg}])]})}]]})])'))
 print(balance_checker('([(([{{({[([{(([[[[(([({(]]))]])])})]}))}}])})]]))'))
 print(balance_checker('{([[({{(({(({[(((({{((([[}}])})))}}})])])))))}])])'))
 print(balance_checker('5]]0fJ{dv))6}]}}{][x][sh({}{[3}(({{]]8{{[{m)30{U)}'))
 print(balance_checker('3[[}[]Ai{(14}6{J7X{T]{)(6b}(T2)})]{)){5]{u6][4(j)}'))
+print(find_imbalance(["(a[b", "]c)", "}"]))  # Expected: 7
 print()
 
 def decimal_base_converter(num, new_base):
@@ -120,61 +141,258 @@ print(decimal_base_converter(31, 2))
 print(decimal_base_converter(233, 8))
 print(decimal_base_converter(233, 16))
 
+"""
+This one only goes up to base 16, gives "" for 0, and is O(d^2) on a number with d digits since every
+step divides the whole number by the base. base_conversion.py has the general version (bases 2-36,
+both directions, big ints split in halves rather than one digit at a time, and batches).
+"""
 
 
-def infix_to_postfix(infix_str):
-    operators = ["(","+","-","*","/","^"]
 
+"""
+The first version of infix_to_postfix below went character by character, so it could only handle
+single-character operands ('12' came out as '1' and '2'), and it found precedence with
+operators.index(...) - a linear scan of a list on every comparison. It also ranked '+' below '-'
+just because of where they sat in that list.
+
+So we split the job in two. First a TOKENIZER: one compiled regular expression that pulls out whole
+numbers (ints and floats), identifiers and operators, skipping whitespace. re.finditer walks the
+string once and hands back one token at a time. Then the conversion itself (the shunting-yard
+algorithm) looks precedence up in a dict - O(1) - and knows that '^' is RIGHT-associative:
+2 ^ 3 ^ 2 means 2 ^ (3 ^ 2), so an equal-precedence '^' on the stack must NOT be popped first.
+
+Both parts are generators, so tokens stream straight through without building any strings
+per character. The postfix output is space separated, since '12 3 +' and '1 23 +' need telling apart.
+"""
+
+import operator
+
+TOKEN_RE = re.compile(r"\s*(?:(\d+\.?\d*|\.\d+)(?![.\d])|([A-Za-z_]\w*)|(\S))")
+PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2, "^": 3}
+RIGHT_ASSOCIATIVE = {"^"}
+BINARY_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "^": operator.pow,
+}
+
+def tokenize(expr):
+    for match in TOKEN_RE.finditer(expr):
+        number, name, symbol = match.groups()
+        if number:
+            yield number
+        elif name:
+            yield name
+        elif symbol in PRECEDENCE or symbol in "()":
+            yield symbol
+        elif symbol.isdigit() or symbol == ".":
+            raise ValueError(f"Malformed number at offset {match.start(3)}.")  # e.g. 1.2.3
+        else:
+            raise ValueError(f"Unexpected character {symbol!r} at offset {match.start(3)}.")
+
+def is_operand(tok):
+    return tok[0].isalnum() or tok[0] in "._"
+
+def postfix_tokens(tokens):
     op_stack = Stack()
-    output = []
-    for tok in infix_str:
-        if tok.isalnum():
-            output.append(tok)
+    for tok in tokens:
+        if is_operand(tok):
+            yield tok
         elif tok == "(":
             op_stack.push(tok)
         elif tok == ")":
             op = op_stack.pop()
             while op != "(":
-                output.append(op)
+                if op is None:
+                    raise ValueError("Unbalanced ')'.")
+                yield op
                 op = op_stack.pop()
-        elif tok in operators:
-            while not op_stack.is_empty() and operators.index(op_stack.peek()) >= operators.index(tok):
-                output.append(op_stack.pop())
+        else:
+            prec = PRECEDENCE[tok]
+            right = tok in RIGHT_ASSOCIATIVE
+            while not op_stack.is_empty() and op_stack.peek() != "(":
+                top = PRECEDENCE[op_stack.peek()]
+                if top > prec or (top == prec and not right):
+                    yield op_stack.pop()
+                else:
+                    break
             op_stack.push(tok)
 
     while not op_stack.is_empty():
-        output.append(op_stack.pop())
+        op = op_stack.pop()
+        if op == "(":
+            raise ValueError("Unbalanced '('.")
+        yield op
 
-    return "".join(output)
+def infix_to_postfix(infix_str):
+    return " ".join(postfix_tokens(tokenize(infix_str)))
 
 print(infix_to_postfix("A * B + C * D"))
 print(infix_to_postfix("( A + B ) * C - ( D - E ) * ( F + G )"))
 print(infix_to_postfix("A+B-C-D-E*F+G"))
 print(infix_to_postfix("5 * 3 ^ (4 - 2)"))
+print(infix_to_postfix("2 ^ 3 ^ 2 + price * 1.5"))
 
 def do_math(op, op1, op2):
-    if op == "*":
-        return op1 * op2
-    elif op == "/":
-        return op1 / op2
-    elif op == "+":
-        return op1 + op2
-    else:
-        return op1 - op2
+    return BINARY_OPS[op](op1, op2)
 
-def postfix_eval(postfix):
+def to_number(tok):
+    return float(tok) if "." in tok else int(tok)
+
+def postfix_eval(postfix, bindings=None):
+    # postfix can be a space separated string or any iterable of tokens (e.g. from postfix_tokens).
+    # Identifiers are looked up in bindings.
+    tokens = tokenize(postfix) if isinstance(postfix, str) else postfix
     operands = Stack()
-    for tok in postfix:
-        if tok.isalnum():
-            operands.push(int(tok))
-        elif tok in ["+","-","*","/"]:
+    for tok in tokens:
+        if tok in BINARY_OPS:
+            if operands.size() < 2:
+                raise ValueError(f"Missing operand for {tok}.")
             op1, op2 = operands.pop(), operands.pop()
             result = do_math(tok, op2, op1)
             operands.push(result)
-    
+        elif tok[0].isdigit() or tok[0] == ".":
+            operands.push(to_number(tok))
+        else:
+            if bindings is None or tok not in bindings:
+                raise ValueError(f"No value given for {tok}.")
+            operands.push(bindings[tok])
+
+    if operands.size() != 1:
+        raise ValueError("Expression doesn't reduce to a single value.")
     return operands.pop()
 
 print(postfix_eval("7 8 + 3 2 + /"))
+print(postfix_eval(infix_to_postfix("12 * (x + 0.5)"), {"x": 2}))
+
+"""
+If the same formula gets evaluated over and over with different values (say 'price * (1 + tax)'
+for every order), re-tokenizing and re-converting it every time is wasted work - the postfix
+form never changes, only the numbers going in.
+
+So we COMPILE it once: run the tokenizer and shunting-yard, then turn the postfix tokens into a
+little program where numbers are already converted, operators are already looked up to their
+functions, and variables are just names to fetch. evaluate(bindings) then only runs that program.
+
+compile_expression is wrapped in functools.lru_cache, keyed by the formula text, so compiling
+a formula we've seen recently is just a dict lookup. The cache keeps the most recently used
+formulas and drops the least recently used once it's full. compile_expression.cache_info()
+reports the hits and misses.
+"""
+
+from functools import lru_cache
+
+LOAD_VARIABLE = object()  # Marks program steps that fetch a variable from the bindings
+
+class CompiledExpression:
+    def __init__(self, formula):
+        self.formula = formula
+        self.postfix = tuple(postfix_tokens(tokenize(formula)))
+        self._program = []  # (op function, None for a constant, or LOAD_VARIABLE; argument)
+        variables = {}
+        depth = 0
+        for tok in self.postfix:
+            if tok in BINARY_OPS:
+                self._program.append((BINARY_OPS[tok], tok))
+                depth -= 1
+            elif tok[0].isdigit() or tok[0] == ".":
+                self._program.append((None, to_number(tok)))
+                depth += 1
+            else:
+                self._program.append((LOAD_VARIABLE, tok))
+                variables[tok] = None
+                depth += 1
+            if depth < 1:
+                raise ValueError(f"Missing operand in {formula!r}.")
+        if depth != 1:
+            raise ValueError(f"{formula!r} doesn't reduce to a single value.")
+        self.variables = tuple(variables)
+
+    def __repr__(self):
+        return f"CompiledExpression({self.formula!r})"
+
+    def evaluate(self, bindings=None):
+        bindings = bindings or {}
+        missing = [name for name in self.variables if name not in bindings]
+        if missing:
+            raise ValueError(f"No value given for {', '.join(missing)}.")
+
+        stack = []
+        push, pop = stack.append, stack.pop
+        for func, arg in self._program:
+            if func is None:
+                push(arg)
+            elif func is LOAD_VARIABLE:
+                push(bindings[arg])
+            else:
+                right = pop()
+                push(func(pop(), right))
+        return stack[0]
+
+    def evaluate_columns(self, columns, chunk_size=None):
+        # columns maps each variable to a 1-D array of values (one per row). Returns one array of
+        # results, doing one NumPy operation per token instead of running evaluate() per row.
+        import numpy as np
+
+        arrays = {name: np.asarray(columns[name]) for name in self.variables if name in columns}
+        missing = [name for name in self.variables if name not in arrays]
+        if missing:
+            raise ValueError(f"No column given for {', '.join(missing)}.")
+        lengths = {len(array) for array in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must be the same length.")
+        rows = lengths.pop() if lengths else 1
+
+        if chunk_size is None or chunk_size >= rows:
+            return self._evaluate_block(np, arrays, rows)
+        # Big batches go through in chunks, so the temporaries stay small (and in cache).
+        parts = [
+            self._evaluate_block(np, {name: array[start:start + chunk_size] for name, array in arrays.items()},
+                                 min(chunk_size, rows - start))
+            for start in range(0, rows, chunk_size)
+        ]
+        return np.concatenate(parts)
+
+    def _evaluate_block(self, np, arrays, rows):
+        ufuncs = {"+": np.add, "-": np.subtract, "*": np.multiply, "/": np.true_divide, "^": np.power}
+        stack = []  # (value, owned) - owned arrays are temporaries we're free to overwrite
+        for func, arg in self._program:
+            if func is None:
+                stack.append((arg, False))
+            elif func is LOAD_VARIABLE:
+                stack.append((arrays[arg], False))
+            else:
+                (right, right_owned), (left, left_owned) = stack.pop(), stack.pop()
+                ufunc = ufuncs[arg]
+                # '/' and '^' always go through float64, like evaluate() does for 1 / 2 or 2 ^ -1.
+                promote = arg in "/^"
+                dtype = np.result_type(left, right, np.float64) if promote else np.result_type(left, right)
+                out = None
+                # Write into a temporary when we can, instead of allocating another array.
+                if left_owned and left.dtype == dtype:
+                    out = left
+                elif right_owned and right.dtype == dtype and np.ndim(left) <= 1:
+                    out = right
+                value = ufunc(left, right, out=out, dtype=dtype) if promote else ufunc(left, right, out=out)
+                stack.append((value, np.ndim(left) + np.ndim(right) > 0))
+        result, owned = stack[0]
+        if np.ndim(result) == 0:
+            return np.broadcast_to(result, (rows,)).copy()
+        return result if owned else result.copy()  # Never hand back the caller's own column
+
+@lru_cache(maxsize=1024)
+def compile_expression(formula):
+    return CompiledExpression(formula)
+
+def evaluate_infix(formula, bindings=None):
+    return compile_expression(formula).evaluate(bindings)
+
+price = compile_expression("price * (1 + tax) - discount")
+print(price.variables, price.evaluate({"price": 100, "tax": 0.1, "discount": 5}))
+print(evaluate_infix("price * (1 + tax) - discount", {"price": 20, "tax": 0.2, "discount": 0}))
+print(compile_expression.cache_info())
 
 """
 Essentially: any time you need to reverse the order of the items in your algorithm,
@@ -261,8 +479,74 @@ Note! enqueue and all operations on either end become O(1) when implemented with
 enqueue() : O(n)
 dequeue() : O(1)
 search/insert : O(n)
+
+But you don't actually need nodes to get O(1) at both ends - a CIRCULAR ARRAY (ring buffer)
+does it too. Preallocate a list of slots, keep an index to the front and a count, and let the
+rear wrap around to the start of the list with modulo. Nothing ever gets shifted.
+
+When the buffer fills up we double it (copying everything once), and when it drains to a quarter
+full we halve it again. Each copy is paid for by the enqueues/dequeues since the last resize, so
+both operations are AMORTIZED O(1) - same trick Python lists use for append.
 """
 
+class RingQueue(Queue):
+    def __init__(self, capacity=8):
+        self._min_capacity = max(1, capacity)
+        self._items = [None] * self._min_capacity
+        self._head = 0  # Slot of the front item
+        self._count = 0
+
+    def __repr__(self):
+        # Rear on the left, front on the right - same as Queue.
+        return f"RingQueue{self._ordered()[::-1]}"
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def capacity(self):
+        return len(self._items)
+
+    def _ordered(self):
+        cap = len(self._items)
+        return [self._items[(self._head + i) % cap] for i in range(self._count)]
+
+    def _resize(self, capacity):
+        items = self._ordered()
+        self._items = items + [None] * (capacity - len(items))
+        self._head = 0
+
+    def enqueue(self, item):
+        cap = len(self._items)
+        if self._count == cap:
+            cap *= 2
+            self._resize(cap)
+        self._items[(self._head + self._count) % cap] = item
+        self._count += 1
+
+    def dequeue(self):
+        if not self._count:
+            return None
+        item = self._items[self._head]
+        self._items[self._head] = None  # Don't keep a reference to dequeued items alive
+        self._head = (self._head + 1) % len(self._items)
+        self._count -= 1
+
+        cap = len(self._items)
+        if cap > self._min_capacity and self._count <= cap // 4:
+            self._resize(max(cap // 2, self._min_capacity))
+        return item
+
+rq = RingQueue(capacity=2)
+rq.enqueue(4)
+rq.enqueue("dog")
+rq.enqueue(True)
+print(rq)
+print(rq.size(), rq.capacity)
+print(rq.dequeue())
+print(rq.dequeue())
+print(rq.is_empty())
+
 def josephus(n, k):
     romans = Queue()
     for x in range(1,n+1):
@@ -278,6 +562,90 @@ def josephus(n, k):
 
 josephus(41, 3)
 
+"""
+The simulation above does about n*k dequeue/enqueue cycles, and each enqueue is O(n) with the
+list insert - fine for 41 romans, hopeless for millions. We don't actually need to simulate anything
+though.
+
+Number everyone from 0. Once the first person (index k-1) is gone, the circle is just a circle of
+n-1 people starting at index k. So if someone is at index p in the smaller circle, they were at
+(p + k) % n in the original one. Starting from the survivors of a circle that's already down to its
+last few people, and applying that n times, gives the survivors in O(n).
+
+For k much smaller than n we can do better: one full lap around the circle removes n // k people at
+once, and the same kind of index shift maps the smaller circle back to the original. Each lap shrinks
+the circle by a factor of about (k-1)/k, so that's O(k log n) laps.
+
+The full elimination order needs an ORDER STATISTIC tree instead: something that can find "the i-th
+person still standing" and remove them in O(log n). A Fenwick (binary indexed) tree of 1s and 0s does
+that - it's just a list where slot i holds the count of a power-of-two sized block ending at i.
+"""
+
+def _josephus_linear(n, k, count):
+    # Indices (0-based) of the last `count` survivors, built back up one person at a time.
+    positions = list(range(count))
+    for size in range(count + 1, n + 1):
+        positions = [(p + k) % size for p in positions]
+    return positions
+
+def _josephus_laps(n, k, count):
+    sizes = []
+    while k > 1 and n >= k and n - n // k >= count:
+        sizes.append(n)
+        n -= n // k  # One lap removes every k-th person
+    positions = _josephus_linear(n, k, count)
+
+    # Undo the laps, largest circle last. After a lap the count restarts just past the last person
+    # removed, which is index (n // k) * k of the bigger circle.
+    while sizes:
+        size = sizes.pop()
+        shifted = []
+        for p in positions:
+            p -= size % k
+            if p < 0:
+                p += size
+            else:
+                p += p // (k - 1)
+            shifted.append(p)
+        positions = shifted
+    return positions
+
+def josephus_survivors(n, k, count=2):
+    if not 1 <= count <= n or k < 1:
+        raise ValueError("Need k >= 1 and between 1 and n survivors.")
+    return sorted(p + 1 for p in _josephus_laps(n, k, count))
+
+def josephus_order(n, k):
+    # The order people are removed in, 1-based, ending with the last survivor.
+    if n < 1 or k < 1:
+        raise ValueError("Need n >= 1 and k >= 1.")
+    tree = [0] * (n + 1)
+    for i in range(1, n + 1):
+        tree[i] = i & -i  # Everyone starts alive, so each block's count is just its size
+    top = 1 << n.bit_length()
+
+    order = []
+    index = 0
+    for remaining in range(n, 0, -1):
+        index = (index + k - 1) % remaining
+        # Walk down the tree for the (index+1)-th person still alive.
+        pos, rank, step = 0, index + 1, top
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] < rank:
+                pos = nxt
+                rank -= tree[nxt]
+            step >>= 1
+        pos += 1
+        order.append(pos)
+        while pos <= n:
+            tree[pos] -= 1
+            pos += pos & -pos
+    return order
+
+print(josephus_survivors(41, 3))  # Same 16 and 31 as the simulation
+print(josephus_order(7, 3))  # Expected: [3, 6, 2, 7, 5, 1, 4]
+
 """
 
 Essentially, think of queues as simply real-life queues. Use them when you need to queue
@@ -307,35 +675,131 @@ Deques are pretty similar to queues in terms of time complexity, just with more
 E.g. for [1, 2, 3] you can both append 4 = [1,2,3,4], pop = [1,2], appendleft 0 = [0,1,2,3], or pop(0) = [2,3].
 All in O(1) time if implemented properly (with Nodes / LinkedLists).
 
-The implementation below is a simplified version without nodes, costing O(n) to add/pop from the tail
-but O(1) to add/pop from the head.
+The implementation below doesn't use one node per item, though. Instead it's BLOCK-LINKED
+(the same layout CPython's collections.deque uses): items live in fixed-size blocks of 64 slots,
+and the blocks are doubly linked together. Adding at either end just fills the next free slot of
+the end block, only allocating a new block every 64 items. So it's O(1) at both ends, with far
+fewer objects than a node per item, and neighbouring items sit next to each other in memory.
+
+The rear is the 'left' end and the front is the 'right' end, same as the old list version.
+
+Passing maxlen makes it a bounded deque - once it's full, adding at one end evicts from the
+other. Great for sliding windows (e.g. 'the last 100 readings').
 """
 
+BLOCK_SIZE = 64
+BLOCK_CENTER = (BLOCK_SIZE - 1) // 2
+
+class _Block:
+    __slots__ = ("items", "prev", "next")
+
+    def __init__(self, prev=None, next=None):
+        self.items = [None] * BLOCK_SIZE
+        self.prev = prev
+        self.next = next
+
 class Deque:
 
-    def __init__(self):
-        self._items = []
+    def __init__(self, maxlen=None):
+        if maxlen is not None and maxlen < 0:
+            raise ValueError("maxlen must be non-negative.")
+        self._maxlen = maxlen
+        self._left = self._right = _Block()
+        # Empty deque: the right index sits one slot before the left index.
+        self._left_idx = BLOCK_CENTER + 1
+        self._right_idx = BLOCK_CENTER
+        self._size = 0
 
     def __repr__(self):
-        return f"Deque{self._items}"
+        return f"Deque{list(self)}"
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        # Rear to front.
+        block, idx, remaining = self._left, self._left_idx, self._size
+        while remaining:
+            yield block.items[idx]
+            remaining -= 1
+            idx += 1
+            if idx == BLOCK_SIZE:
+                block, idx = block.next, 0
+
+    @property
+    def maxlen(self):
+        return self._maxlen
+
+    def _reset(self):
+        self._left = self._right
+        self._left_idx = BLOCK_CENTER + 1
+        self._right_idx = BLOCK_CENTER
 
     def add_front(self, item):
-        self._items.append(item)
+        if self._maxlen == 0:
+            return
+        if self._right_idx == BLOCK_SIZE - 1:
+            block = _Block(prev=self._right)
+            self._right.next = block
+            self._right = block
+            self._right_idx = -1
+        self._right_idx += 1
+        self._right.items[self._right_idx] = item
+        self._size += 1
+        if self._maxlen is not None and self._size > self._maxlen:
+            self.remove_rear()
 
     def add_rear(self, item):
-        self._items.insert(0, item)
+        if self._maxlen == 0:
+            return
+        if self._left_idx == 0:
+            block = _Block(next=self._left)
+            self._left.prev = block
+            self._left = block
+            self._left_idx = BLOCK_SIZE
+        self._left_idx -= 1
+        self._left.items[self._left_idx] = item
+        self._size += 1
+        if self._maxlen is not None and self._size > self._maxlen:
+            self.remove_front()
 
     def remove_front(self):
-        return self._items.pop() if self._items else None
+        if not self._size:
+            return None
+        block = self._right
+        item = block.items[self._right_idx]
+        block.items[self._right_idx] = None
+        self._right_idx -= 1
+        self._size -= 1
+        if not self._size:
+            self._reset()
+        elif self._right_idx < 0:
+            self._right = block.prev
+            self._right.next = None
+            self._right_idx = BLOCK_SIZE - 1
+        return item
     
     def remove_rear(self):
-        return self._items.pop(0) if self._items else None
+        if not self._size:
+            return None
+        block = self._left
+        item = block.items[self._left_idx]
+        block.items[self._left_idx] = None
+        self._left_idx += 1
+        self._size -= 1
+        if not self._size:
+            self._reset()
+        elif self._left_idx == BLOCK_SIZE:
+            self._left = block.next
+            self._left.prev = None
+            self._left_idx = 0
+        return item
     
     def is_empty(self):
-        return not bool(self._items)
+        return self._size == 0
     
     def size(self):
-        return len(self._items)
+        return self._size
 
     
 print("\n~~~Deques~~~")
@@ -353,6 +817,11 @@ d.add_rear(8.4)
 print(d.remove_rear())
 print(d.remove_front())
 
+window = Deque(maxlen=3)
+for reading in [5, 7, 3, 9, 4]:
+    window.add_front(reading)
+print(window) # Only the last 3 readings are kept: [3, 9, 4]
+
 def palindrome_checker(pal):
     d = Deque()
     for char in pal:
@@ -431,6 +900,52 @@ class Node:
     def __repr__(self):
         return f"Node({self.value})" 
 
+"""
+Every Node above carries a whole __dict__ (a hash table!) just to hold two attributes, and every
+.value/.next goes through a property. Fine for learning, but with millions of nodes that overhead
+is most of your memory.
+
+__slots__ fixes that. It tells Python the exact attributes an instance will ever have, so it
+stores them in fixed slots on the object instead of a __dict__. We also drop the properties and
+expose plain attributes - the encapsulation rule above is bent on purpose here, since a compact
+node is an internal detail of the list that owns it anyway.
+"""
+
+class SlotNode:
+    __slots__ = ("value", "next")
+
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+
+    def __repr__(self):
+        return f"Node({self.value})"
+
+def _build_chain(make_node, iterable, doubly=False):
+    # Links up a whole run of new nodes in one pass, ready to be spliced onto a list.
+    # Returns (first node, last node, number of nodes).
+    dummy = last = make_node(None)
+    count = 0
+    if doubly:
+        for item in iterable:
+            node = make_node(item)
+            node.prev = last
+            last.next = node
+            last = node
+            count += 1
+    else:
+        for item in iterable:
+            node = make_node(item)
+            last.next = node
+            last = node
+            count += 1
+    if not count:
+        return None, None, 0
+    first = dummy.next
+    if doubly:
+        first.prev = None
+    return first, last, count
+
 print("\n~~~Linked Lists~~~")
 
 head = Node(0)
@@ -447,30 +962,83 @@ what we have immediate access to. O(1) implementation.
 
 The idea of the LinkedList is to ensure the developer never has to interact with
 or create a Node. They just use the LinkedList object.
+
+Since the developer never touches the nodes, the list can also choose WHICH node class to use.
+Pass compact=True to build the list out of SlotNodes instead.
+
+Building a big list one add() at a time works, but from_iterable()/extend() link the whole
+run of new nodes in one pass and splice it on the end in one go.
+
+We also keep a 'size' attribute and a TAIL pointer, updated by every method that adds or
+removes a node. That makes size() and append() O(1). Popping the tail is still a walk though -
+we need the node BEFORE the tail to unlink it, and a singly linked node can't look backwards.
+
+Caching values like this is only safe if every mutator keeps them right, so debug=True
+re-walks the list after every change and complains if the cached size or tail has drifted.
 """
 
+def _check_chain(linked_list):
+    count, last = 0, None
+    curr = linked_list.head
+    while curr:
+        count += 1
+        last = curr
+        curr = curr.next
+    if count != linked_list._size:
+        raise AssertionError(f"Cached size {linked_list._size} but the chain has {count} nodes.")
+    if last is not linked_list.tail:
+        raise AssertionError(f"Cached tail {linked_list.tail} but the chain ends at {last}.")
+
+def _enable_invariant_checks(linked_list, *method_names):
+    # Wrap the methods on this one instance, so lists without debug pay nothing.
+    for name in method_names:
+        method = getattr(linked_list, name)
+        def checked(*args, _method=method, **kwargs):
+            result = _method(*args, **kwargs)
+            _check_chain(linked_list)
+            return result
+        setattr(linked_list, name, checked)
+
 class LinkedList:
-    def __init__(self):
-        self.head = None
+    def __init__(self, compact=False, debug=False):
+        self.head = self.tail = None
+        self._size = 0
+        self._node = SlotNode if compact else Node
+        if debug:
+            _enable_invariant_checks(self, "add", "remove", "append", "insert", "pop", "extend")
+
+    @classmethod
+    def from_iterable(cls, iterable, compact=False):
+        linked_list = cls(compact)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def extend(self, iterable):
+        first, last, count = _build_chain(self._node, iterable)
+        if not count:
+            return
+        if self.tail:
+            self.tail.next = first
+        else:
+            self.head = first
+        self.tail = last
+        self._size += count
 
     def is_empty(self):
         return self.head == None
     
     def size(self):
-        # Note that this is inefficient - simply for learning how to traverse the linkedlist.
-        # Normally you'll have a 'size' attribute that is incremented or decremented when nodes
-        # are added to the linked list.
-        ctr = 0
-        curr = self.head
-        while curr:
-            ctr += 1
-            curr = curr.next
-        return ctr
+        # This used to walk the whole list to count the nodes - good for learning how to
+        # traverse a linked list, but O(n). Now add/remove/etc keep _size up to date instead.
+        return self._size
 
     def add(self, item):
-        curr = Node(item)
+        curr = self._node(item)
         curr.next = self.head
         self.head = curr
+        if self.tail is None:
+            self.tail = curr
+        self._size += 1
 
     def search(self, item):
         curr = self.head
@@ -480,13 +1048,20 @@ class LinkedList:
             curr = curr.next
         return False
     
-    def __str__(self):
-        values = []
+    def __iter__(self):
         curr = self.head
         while curr:
-            values.append(str(curr.value))
+            yield curr.value
             curr = curr.next
-        return " -> ".join(values)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, item):
+        return self.search(item)
+
+    def __str__(self):
+        return " -> ".join(str(value) for value in self)
 
 # Note in remove(): if the list is empty, we don't raise an error of sorts.
 # The reason why is because removing from an empty list is a feasibly common 
@@ -505,83 +1080,87 @@ class LinkedList:
             return
         if curr.value == item:
             self.head = curr.next
+            if self.head is None:
+                self.tail = None
+            self._size -= 1
             return
         while curr.next:
             if curr.next.value == item:
+                if curr.next is self.tail:
+                    self.tail = curr
                 curr.next = curr.next.next
+                self._size -= 1
                 return
             curr = curr.next
         
         raise ValueError(f"{item} is not in LinkedList.")
     
     def append(self, item):
-        curr = self.head
-        if not curr:
-            self.head = Node(item)
-            return
-        while curr.next:
-            curr = curr.next
-        curr.next = Node(item)
+        new_node = self._node(item)
+        if not self.tail:
+            self.head = self.tail = new_node
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+        self._size += 1
 
     def insert(self, item, idx):
         if idx < 0:
             raise IndexError(f"Index cannot be negative.")
-        
-        new_node = Node(item)
+        if idx > self._size:
+            raise IndexError(f"Index {idx} out of range.")
         if idx == 0:
-            new_node.next = self.head
-            self.head = new_node
-            return
+            return self.add(item)
+        if idx == self._size:
+            return self.append(item)
         
+        new_node = self._node(item)
         curr = self.head
-        curr_idx = 0
-        while curr:
-            if curr_idx == idx-1:
-                new_node.next = curr.next
-                curr.next = new_node
-                return
+        for _ in range(idx - 1):
             curr = curr.next
-            curr_idx += 1
-
-        raise IndexError(f"Index {idx} out of range.")
+        new_node.next = curr.next
+        curr.next = new_node
+        self._size += 1
 
     def pop(self, idx=None):
         if idx is None:
-            if self.size() == 0:
+            if self._size == 0:
                 return None
-            idx = self.size() - 1
+            idx = self._size - 1
         if idx < 0:
             raise IndexError(f"Index cannot be negative.")
+        if idx >= self._size:
+            raise IndexError(f"{idx} out of range.")
         
         curr = self.head
         if idx == 0:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            self._size -= 1
             return curr.value
 
-        curr_idx = 0
-        while curr.next:
-            if curr_idx == idx-1:
-                result = curr.next.value
-                curr.next = curr.next.next
-                return result
+        for _ in range(idx - 1):
             curr = curr.next
-            curr_idx += 1
-
-        raise IndexError(f"{idx} out of range.")    
+        result = curr.next.value
+        if curr.next is self.tail:
+            self.tail = curr
+        curr.next = curr.next.next
+        self._size -= 1
+        return result
 
     def index(self, idx):
         if idx < 0:
             raise IndexError(f"Index cannot be negative.")
+        if idx >= self._size:
+            raise IndexError(f"Index {idx} out of range.")
+        if idx == self._size - 1:
+            return self.tail.value
 
-        curr_idx = 0
         curr = self.head
-        while curr:
-            if curr_idx == idx:
-                return curr.value
+        for _ in range(idx):
             curr = curr.next
-            curr_idx += 1
-
-        raise IndexError(f"Index cannot be negative.")
+        return curr.value
 
 my_list = LinkedList()
 
@@ -623,6 +1202,187 @@ print(ll.index(1))  # Expected: 30
 print(ll.pop(0))  # Expected: 10
 print(ll.pop(1))  # Remove 20
 
+"""
+Walking the list with index(i) in a loop is a trap - each index() call walks from the head
+again, so visiting everything costs O(n^2). __iter__ fixes that. It's a GENERATOR (note the
+yield), so it hands back one value at a time while it walks, never building a list of values.
+Once a class has __iter__, for loops, list(), sum(), 'in' and str.join all just work.
+__len__ and __contains__ hook up len(my_list) and 'x in my_list' too.
+"""
+
+print(list(my_list), len(my_list), 17 in my_list)
+
+"""
+Even a slotted node is a full Python object per element, plus the int it points to.
+For huge lists of plain numbers we can drop the objects altogether.
+
+The trick is a STRUCT OF ARRAYS: instead of one object holding (value, next), keep one
+array.array of values and a parallel array.array of 'next' indices. A node is now just a
+slot number, and a pointer is just an integer index into the arrays (-1 plays the part of None).
+array.array stores raw machine numbers, so each element costs 16 bytes instead of ~100.
+
+Removed slots go onto a FREE LIST - a chain of empty slots threaded through the same next
+array - and get reused by the next add, so removing doesn't leave holes forever.
+compact() rewrites everything in list order, throwing away the free slots entirely.
+"""
+
+from array import array
+
+NULL = -1
+
+class ArrayLinkedList:
+    def __init__(self, typecode="q"):
+        # typecode is the array.array type of the values, e.g. "q" for ints or "d" for floats.
+        self._values = array(typecode)
+        self._next = array("q")
+        self._head = self._tail = NULL
+        self._free = NULL
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        values, next_ = self._values, self._next
+        slot = self._head
+        while slot != NULL:
+            yield values[slot]
+            slot = next_[slot]
+
+    def __contains__(self, item):
+        return self.search(item)
+
+    def __str__(self):
+        return " -> ".join(str(value) for value in self)
+
+    def is_empty(self):
+        return self._size == 0
+
+    def size(self):
+        return self._size
+
+    def _alloc(self, item):
+        slot = self._free
+        if slot == NULL:
+            self._values.append(item)
+            self._next.append(NULL)
+            return len(self._next) - 1
+        self._values[slot] = item  # First, so a value the array rejects doesn't lose the slot
+        self._free = self._next[slot]
+        self._next[slot] = NULL
+        return slot
+
+    def _unlink(self, prev, slot):
+        # Cut slot out of the chain (prev is NULL when slot is the head) and free it.
+        if prev == NULL:
+            self._head = self._next[slot]
+        else:
+            self._next[prev] = self._next[slot]
+        if slot == self._tail:
+            self._tail = prev
+        self._next[slot] = self._free
+        self._free = slot
+        self._size -= 1
+        return self._values[slot]
+
+    def _slot_at(self, idx):
+        slot = self._head
+        for _ in range(idx):
+            slot = self._next[slot]
+        return slot
+
+    def add(self, item):
+        slot = self._alloc(item)
+        self._next[slot] = self._head
+        self._head = slot
+        if self._tail == NULL:
+            self._tail = slot
+        self._size += 1
+
+    def append(self, item):
+        slot = self._alloc(item)
+        if self._tail == NULL:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._size += 1
+
+    def insert(self, item, idx):
+        if idx < 0:
+            raise IndexError(f"Index cannot be negative.")
+        if idx > self._size:
+            raise IndexError(f"Index {idx} out of range.")
+        if idx == 0:
+            return self.add(item)
+        if idx == self._size:
+            return self.append(item)
+
+        prev = self._slot_at(idx - 1)
+        slot = self._alloc(item)
+        self._next[slot] = self._next[prev]
+        self._next[prev] = slot
+        self._size += 1
+
+    def pop(self, idx=None):
+        if idx is None:
+            if self._size == 0:
+                return None
+            idx = self._size - 1
+        if idx < 0:
+            raise IndexError(f"Index cannot be negative.")
+        if idx >= self._size:
+            raise IndexError(f"{idx} out of range.")
+
+        if idx == 0:
+            return self._unlink(NULL, self._head)
+        prev = self._slot_at(idx - 1)
+        return self._unlink(prev, self._next[prev])
+
+    def remove(self, item):
+        if self._head == NULL:
+            return
+        prev, slot = NULL, self._head
+        while slot != NULL:
+            if self._values[slot] == item:
+                self._unlink(prev, slot)
+                return
+            prev, slot = slot, self._next[slot]
+
+        raise ValueError(f"{item} is not in ArrayLinkedList.")
+
+    def search(self, item):
+        return any(value == item for value in self)
+
+    def index(self, idx):
+        if idx < 0:
+            raise IndexError(f"Index cannot be negative.")
+        if idx >= self._size:
+            raise IndexError(f"Index {idx} out of range.")
+        return self._values[self._slot_at(idx)]
+
+    def compact(self):
+        # Lay the values out in list order, so slot i is simply followed by slot i+1.
+        n = self._size
+        self._values = array(self._values.typecode, self)
+        self._next = array("q", range(1, n + 1))
+        if n:
+            self._next[-1] = NULL
+        self._head, self._tail = (0, n - 1) if n else (NULL, NULL)
+        self._free = NULL
+
+al = ArrayLinkedList()
+for num in [31, 77, 17, 93]:
+    al.append(num)
+al.add(26)
+al.insert(54, 2)
+print(al)
+print(al.pop(), al.pop(0), al.index(1))
+al.remove(77)
+al.add(100)
+al.compact()
+print(al, al.size(), al.search(54))
+
 
 """
 3.22: Sorted Lists
@@ -635,18 +1395,62 @@ Let's go.
 """
 
 class SortedList:
-    def __init__(self):
-        self.head = None
+    def __init__(self, compact=False, debug=False):
+        self.head = self.tail = None
+        self._size = 0
+        self._node = SlotNode if compact else Node
+        if debug:
+            _enable_invariant_checks(self, "add", "remove", "pop", "extend")
 
     def __repr__(self):
         return f"SortedList{self.head}"
+
+    @classmethod
+    def from_iterable(cls, iterable, compact=False):
+        sorted_list = cls(compact)
+        sorted_list.extend(iterable)
+        return sorted_list
+
+    def extend(self, iterable):
+        # Sort the new items once (O(k log k)), then merge them into the chain in one walk,
+        # instead of k separate add() walks. Ties go before existing equal items, like add().
+        new_items = sorted(iterable)
+        if not new_items:
+            return
+        if not self.head:
+            self.head, self.tail, self._size = _build_chain(self._node, new_items)
+            return
+
+        dummy = self._node(None)
+        dummy.next = self.head
+        prev, curr = dummy, self.head
+        for item in new_items:
+            while curr and curr.value < item:
+                prev, curr = curr, curr.next
+            new_node = self._node(item)
+            new_node.next = curr
+            prev.next = new_node
+            prev = new_node
+        if curr is None:
+            self.tail = prev
+        self.head = dummy.next
+        self._size += len(new_items)
     
     def add(self, item):
         curr = self.head
-        new_node = Node(item)
+        new_node = self._node(item)
+        # _size only goes up once the node is linked in, so a comparison that raises leaves it right.
         if not curr or curr.value >= item:
             self.head = new_node
             new_node.next = curr
+            if curr is None:
+                self.tail = new_node
+            self._size += 1
+            return
+        if self.tail.value < item: # Bigger than everything - no need to walk
+            self.tail.next = new_node
+            self.tail = new_node
+            self._size += 1
             return
 
         while curr.next and curr.next.value < item:
@@ -654,18 +1458,25 @@ class SortedList:
 
         new_node.next = curr.next
         curr.next = new_node
+        self._size += 1
 
     def remove(self, item):
         if not self.head:
             return
         if self.head.value == item:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            self._size -= 1
             return
 
         curr = self.head
         while curr.next:
             if curr.next.value == item:
+                if curr.next is self.tail:
+                    self.tail = curr
                 curr.next = curr.next.next
+                self._size -= 1
                 return
             curr = curr.next
         
@@ -686,12 +1497,7 @@ class SortedList:
         return self.head == None
     
     def size(self):
-        curr = self.head
-        ctr = 0
-        while curr:
-            ctr += 1
-            curr = curr.next
-        return ctr
+        return self._size
 
     def index(self, item):
         curr = self.head
@@ -706,35 +1512,45 @@ class SortedList:
     
     def pop(self, idx=None):
         if idx is None:
-            if self.size() == 0:
+            if self._size == 0:
                 return None
-            idx = self.size() - 1
+            idx = self._size - 1
         if idx < 0:
             raise IndexError(f"Index cannot be negative.")
+        if idx >= self._size:
+            raise IndexError(f"{idx} out of range.")
         
         curr = self.head
         if idx == 0:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            self._size -= 1
             return curr.value
 
-        curr_idx = 0
-        while curr.next:
-            if curr_idx == idx-1:
-                result = curr.next.value
-                curr.next = curr.next.next
-                return result
+        for _ in range(idx - 1):
             curr = curr.next
-            curr_idx += 1
-
-        raise IndexError(f"{idx} out of range.")           
+        result = curr.next.value
+        if curr.next is self.tail:
+            self.tail = curr
+        curr.next = curr.next.next
+        self._size -= 1
+        return result
 
-    def __str__(self):
-        values = []
+    def __iter__(self):
         curr = self.head
         while curr:
-            values.append(str(curr.value))
+            yield curr.value
             curr = curr.next
-        return " -> ".join(values)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, item):
+        return self.search(item)
+
+    def __str__(self):
+        return " -> ".join(str(value) for value in self)
 
 print(f"~~~SortedLists~~~")
 
@@ -757,6 +1573,10 @@ print(sl.pop(1))  # Expected: 2
 print(sl.pop()) # Expected: 4
 print(sl.pop()) # Expected: 1
 
+sl = SortedList.from_iterable([5, 1, 3])
+sl.extend([4, 0, 6])
+print(sl) # Expected: 0 -> 1 -> 3 -> 4 -> 5 -> 6
+
 """
 SortedLists are interesting. Because they essentially cost O(n) to do almost every operation,
 but they maintain the order such that retrieving the min is O(1). If you add a tail pointer too
@@ -789,6 +1609,170 @@ It'll typically be:
 
 """
 
+"""
+So how would you make a sorted linked list that isn't O(n) for everything?
+
+One answer is a SKIP LIST. Take the sorted linked list, and give some nodes extra 'express lane'
+pointers that skip over many nodes at once. Every node is on level 0 (the normal list), about
+a quarter of them are also on level 1, a quarter of those on level 2, and so on - decided by
+flipping a (biased) coin when the node is added. To find something you start on the highest lane,
+ride it until the next stop would overshoot, then drop down a lane and repeat.
+
+There are about log(n) lanes and you only take a few steps on each, so add/remove/search are
+O(log n) on average. It's the same idea as binary search, just built out of linked nodes.
+
+If every pointer also remembers its SPAN (how many level-0 nodes it jumps over), we can count
+positions while we walk - so index(item) and pop(idx) become O(log n) too.
+"""
+
+SKIP_MAX_LEVEL = 32
+SKIP_P = 0.25
+
+class _SkipNode:
+    __slots__ = ("value", "next", "span")
+
+    def __init__(self, value, level):
+        self.value = value
+        self.next = [None] * level
+        self.span = [1] * level
+
+class SkipSortedList:
+    def __init__(self):
+        self._head = _SkipNode(None, SKIP_MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+
+    def __iter__(self):
+        return self.irange()
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, item):
+        return self.search(item)
+
+    def __str__(self):
+        return " -> ".join(str(value) for value in self)
+
+    def _random_level(self):
+        level = 1
+        while level < SKIP_MAX_LEVEL and random.random() < SKIP_P:
+            level += 1
+        return level
+
+    def _find(self, item):
+        # Returns the last node before item on each level, and its position (head is 0).
+        update, ranks = [None] * self._level, [0] * self._level
+        x, pos = self._head, 0
+        for lvl in range(self._level - 1, -1, -1):
+            while x.next[lvl] and x.next[lvl].value < item:
+                pos += x.span[lvl]
+                x = x.next[lvl]
+            update[lvl], ranks[lvl] = x, pos
+        return update, ranks
+
+    def _find_position(self, idx):
+        # Same as _find, but walks by position instead of by value.
+        update = [None] * self._level
+        x, pos = self._head, 0
+        for lvl in range(self._level - 1, -1, -1):
+            while x.next[lvl] and pos + x.span[lvl] <= idx:
+                pos += x.span[lvl]
+                x = x.next[lvl]
+            update[lvl] = x
+        return update
+
+    def _unlink(self, update, node):
+        for lvl in range(self._level):
+            if update[lvl].next[lvl] is node:
+                update[lvl].span[lvl] += node.span[lvl] - 1
+                update[lvl].next[lvl] = node.next[lvl]
+            else:
+                update[lvl].span[lvl] -= 1
+        while self._level > 1 and self._head.next[self._level - 1] is None:
+            self._level -= 1
+        self._size -= 1
+        return node.value
+
+    def add(self, item):
+        update, ranks = self._find(item)
+        level = self._random_level()
+        if level > self._level:
+            for lvl in range(self._level, level):
+                # A fresh lane on the head spans the whole list.
+                self._head.span[lvl] = self._size + 1
+                update.append(self._head)
+                ranks.append(0)
+            self._level = level
+
+        node = _SkipNode(item, level)
+        node_rank = ranks[0] + 1
+        for lvl in range(level):
+            prev = update[lvl]
+            node.next[lvl] = prev.next[lvl]
+            prev.next[lvl] = node
+            node.span[lvl] = prev.span[lvl] - (node_rank - ranks[lvl]) + 1
+            prev.span[lvl] = node_rank - ranks[lvl]
+        for lvl in range(level, self._level):
+            update[lvl].span[lvl] += 1
+        self._size += 1
+
+    def remove(self, item):
+        if not self._size:
+            return
+        update, _ = self._find(item)
+        node = update[0].next[0]
+        if node is None or node.value != item:
+            raise ValueError(f"{item} not found in SkipSortedList.")
+        self._unlink(update, node)
+
+    def search(self, item):
+        update, _ = self._find(item)
+        node = update[0].next[0]
+        return node is not None and node.value == item
+
+    def is_empty(self):
+        return self._size == 0
+
+    def size(self):
+        return self._size
+
+    def index(self, item):
+        update, ranks = self._find(item)
+        node = update[0].next[0]
+        if node is None or node.value != item:
+            raise ValueError(f"{item} not in list.")
+        return ranks[0]
+
+    def pop(self, idx=None):
+        if idx is None:
+            if self._size == 0:
+                return None
+            idx = self._size - 1
+        if idx < 0:
+            raise IndexError(f"Index cannot be negative.")
+        if idx >= self._size:
+            raise IndexError(f"{idx} out of range.")
+
+        update = self._find_position(idx)
+        return self._unlink(update, update[0].next[0])
+
+    def irange(self, lo=None, hi=None):
+        # Every item with lo <= item <= hi, in order. Leave lo/hi as None for no bound.
+        node = self._head.next[0] if lo is None else self._find(lo)[0][0].next[0]
+        while node and (hi is None or node.value <= hi):
+            yield node.value
+            node = node.next[0]
+
+skip = SkipSortedList()
+for num in [5, 1, 3, 2, 4, 8, 7]:
+    skip.add(num)
+print(skip)
+print(skip.search(3), skip.index(4))  # Expected: True 3
+print(list(skip.irange(3, 7)))  # Expected: [3, 4, 5, 7]
+skip.remove(3)
+print(skip.pop(), skip.pop(1), skip.size())  # Expected: 8 2 4
+
 # Exercises
 
 print(decimal_base_converter(17, 2))
@@ -804,31 +1788,133 @@ print(postfix_eval("1 2 + 3 + 4 + 5 +"))
 print(postfix_eval("1 2 3 4 5 * + * +"))
 
 
-def html_checker(html): # Assuming tag arrows are correct/simple in the input.
-    tags = Stack()
-    tag = ""
-    opening = None  # Cycle between None, True and False for different scanning states
-    # IN RETROSPECT: try to look for a non-state solution with simple problems first,
-    # because it adds a layer of complexity. But arguably states are good for more difficult
-    # problems, i.e. LeetCode Mediums and Hards so keep them in the bank.
-    for char in html:
-        if char == "<":
-            opening = True
-        elif char == "/" and opening is True:
-            opening = False
-        elif char == ">":
-            if opening is True:
-                tags.push(tag)
-            elif opening is False:
-                if tags.pop() != tag:
-                    return False
-            tag = ""
-            opening = None
-        elif char.isalpha():
-            if opening is not None:
-                tag += char
-    
-    return tags.is_empty()
+"""
+The first html_checker built every tag name one character at a time with tag += char (a new string
+per character), needed the whole document as one string, and assumed every tag was simple -
+no attributes, no <br> or <img/> that never get closed, no comments.
+
+HTMLChecker below is a streaming version, shaped like html.parser: call feed(chunk) as many times
+as you like, then close() to get the answer. A regex picks out each whole tag (name, attributes
+and all), and the name is just a slice of the input. Only an unfinished tag at the end of a chunk
+gets carried over to the next one, so memory stays tiny no matter how big the document is - the
+stack of open tags is the only thing that grows.
+
+It does need a few STATES (inside a comment, inside <script>/<style> where '<' means nothing) -
+past me said to avoid states for simple problems, but this one genuinely has them.
+On failure, checker.error holds (offset, message).
+"""
+
+TAG_RE = re.compile(r"""<(/?)([A-Za-z][^\s/>]*)((?:[^>"']|"[^"]*"|'[^']*')*)>""")
+# The start of a tag that TAG_RE could still match once more text arrives - possibly mid quoted value.
+TAG_PREFIX_RE = re.compile(r"""</?(?:[A-Za-z][^\s/>]*(?:[^>"']|"[^"]*"|'[^']*')*(?:"[^"]*|'[^']*)?)?""")
+RAW_TEXT_END = {name: re.compile(rf"</{name}\s*>", re.IGNORECASE) for name in ("script", "style")}
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+MAX_TAG_LENGTH = 1 << 16
+RAW_TEXT_KEEP = 32  # Enough to catch a '</script >' split across two chunks
+
+class HTMLChecker:
+    def __init__(self):
+        self._open = Stack()  # (tag name, offset) of every unclosed tag
+        self._pending = ""  # Unprocessed tail of the last chunk
+        self._base = 0  # Offset of _pending within the whole document
+        self._in_comment = False
+        self._raw_end = None  # Set while inside <script>/<style>
+        self.error = None
+
+    def _fail(self, offset, message):
+        self.error = (offset, message)
+
+    def feed(self, chunk):
+        if self.error:
+            return
+        data = self._pending + chunk
+        pos, n = 0, len(data)
+        while pos < n:
+            if self._in_comment:
+                end = data.find("-->", pos)
+                if end == -1:
+                    pos = max(pos, n - 2)
+                    break
+                self._in_comment = False
+                pos = end + 3
+                continue
+            if self._raw_end:
+                match = self._raw_end.search(data, pos)
+                if match is None:
+                    pos = max(pos, n - RAW_TEXT_KEEP)
+                    break
+                self._raw_end = None
+                self._open.pop()
+                pos = match.end()
+                continue
+
+            lt = data.find("<", pos)
+            if lt == -1:
+                pos = n
+                break
+            if lt + 1 == n or (data[lt + 1] == "!" and n - lt < 4):
+                pos = lt  # Can't tell what this is yet
+                break
+            if data.startswith("<!--", lt):
+                self._in_comment = True
+                pos = lt + 4
+                continue
+            if data[lt + 1] in "!?":  # <!DOCTYPE ...> and friends
+                end = data.find(">", lt)
+                if end == -1:
+                    pos = lt
+                    break
+                pos = end + 1
+                continue
+            if data[lt + 1] != "/" and not data[lt + 1].isalpha():
+                pos = lt + 1  # Just a '<' in the text
+                continue
+
+            match = TAG_RE.match(data, lt)
+            if match is None:
+                if data.find(">", lt) == -1 or TAG_PREFIX_RE.fullmatch(data, lt):
+                    pos = lt  # Tag continues in the next chunk (a '>' so far may be inside quotes)
+                    break
+                return self._fail(self._base + lt, "Malformed tag.")
+            pos = match.end()
+            closing, name, attrs = match.groups()
+            name = name.lower()
+            offset = self._base + lt
+            if name in VOID_ELEMENTS:
+                continue
+            if closing:
+                if self._open.is_empty():
+                    return self._fail(offset, f"</{name}> has no matching opening tag.")
+                open_name, open_offset = self._open.pop()
+                if open_name != name:
+                    return self._fail(offset, f"</{name}> doesn't close <{open_name}> from offset {open_offset}.")
+            elif not attrs.rstrip().endswith("/"):
+                self._open.push((name, offset))
+                self._raw_end = RAW_TEXT_END.get(name)
+
+        self._pending = data[pos:]
+        self._base += pos
+        if len(self._pending) > MAX_TAG_LENGTH:
+            self._fail(self._base, "Tag is too long or never closed.")
+
+    def close(self):
+        if self.error is None:
+            if self._in_comment:
+                self._fail(self._base, "Comment is never closed.")
+            elif not self._open.is_empty():
+                name, offset = self._open.peek()
+                self._fail(offset, f"<{name}> is never closed.")
+            elif self._pending:
+                self._fail(self._base, "Tag is never finished.")
+        return self.error is None
+
+def html_checker(html):
+    checker = HTMLChecker()
+    checker.feed(html)
+    return checker.close()
 
 html_str = """
 <html>
@@ -845,6 +1931,11 @@ html_str = """
 """
 print(f"HTML was checked and returned {html_checker(html_str)}.")
 
+checker = HTMLChecker()
+for chunk in ['<div class="a>b"><br><img src=x.png/><!-- <p> -', '-></di', 'v><p>']:
+    checker.feed(chunk)
+print(checker.close(), checker.error)  # Expected: False (55, '<p> is never closed.')
+
 def palindrome_checker_spaces(pal):
     d = Deque()
     for char in pal:
@@ -861,20 +1952,47 @@ print(f"{palindrome_spaces} was checked as a palindrome and returned {palindrome
 
 
 class NodeQueue:
-    def __init__(self):
+    def __init__(self, compact=False):
         self.head = self.tail = None
         self.size = 0
+        self._node = SlotNode if compact else Node
+
+    @classmethod
+    def from_iterable(cls, iterable, compact=False):
+        queue = cls(compact)
+        queue.extend(iterable)
+        return queue
+
+    def extend(self, iterable):
+        # Enqueues everything in order.
+        first, last, count = _build_chain(self._node, iterable)
+        if not count:
+            return
+        if self.tail:
+            self.tail.next = first
+        else:
+            self.head = first
+        self.tail = last
+        self.size += count
     
+    def __iter__(self):
+        # Front to back, without dequeuing anything.
+        curr = self.head
+        while curr:
+            yield curr.value
+            curr = curr.next
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, item):
+        return any(value == item for value in self)
+
     def __repr__(self):
-        values = []
-        current = self.head
-        while current:
-            values.append(str(current.value))
-            current = current.next
-        return " -> ".join(values) if values else "Queue is empty."
+        return " -> ".join(str(value) for value in self) if self.size else "Queue is empty."
     
     def enqueue(self, item):
-        new_node = Node(item)
+        new_node = self._node(item)
         if not self.tail:
             self.head = self.tail = new_node
         else:
@@ -914,6 +2032,294 @@ Queue with O(1) enqueue and O(1) dequeue implemented.
 Key thing to notice is that the self.head is on the 'left' instead of the right
 as compared to just using Python lists.
 
+NodeQueue isn't safe to share between threads, though. Two threads enqueuing at once can both
+read the same self.tail and one of the new nodes just vanishes. ConcurrentNodeQueue below guards
+the pointer updates with a lock, and uses two CONDITIONS on that lock so threads can sleep until
+there's something to take (not_empty) or room to put (not_full) - producer/consumer style.
+
+True lock-free queues need atomic compare-and-swap, which Python doesn't give us. The next best
+thing is to hold the lock for as little as possible (just the pointer swaps), and to let consumers
+grab a whole batch per lock with dequeue_many() instead of paying for the lock once per item.
+
+With a maxsize, enqueue() blocks when the queue is full. That's BACK-PRESSURE - fast producers
+get slowed down to the speed of the consumers instead of filling up memory.
+Non-blocking calls (or timeouts running out) raise queue.Empty / queue.Full, same as queue.Queue.
+"""
+
+import threading
+import time
+from queue import Empty, Full
+
+class ConcurrentNodeQueue(NodeQueue):
+    def __init__(self, compact=False, maxsize=0):
+        super().__init__(compact)
+        self.maxsize = maxsize  # 0 means unbounded
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def _wait_for(self, condition, ready, block, timeout, error):
+        # Must be called with the lock held.
+        if not block:
+            if not ready():
+                raise error
+        elif timeout is None:
+            while not ready():
+                condition.wait()
+        elif timeout < 0:
+            raise ValueError("timeout must be non-negative.")
+        else:
+            deadline = time.monotonic() + timeout
+            while not ready():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise error
+                condition.wait(remaining)
+
+    def _has_room(self):
+        return self.maxsize <= 0 or self.size < self.maxsize
+
+    def _has_items(self):
+        return self.size > 0
+
+    def enqueue(self, item, block=True, timeout=None):
+        with self._not_full:
+            self._wait_for(self._not_full, self._has_room, block, timeout, Full)
+            super().enqueue(item)
+            self._not_empty.notify()
+
+    def extend(self, iterable):
+        for item in iterable:
+            self.enqueue(item)
+
+    def dequeue(self, block=True, timeout=None):
+        with self._not_empty:
+            self._wait_for(self._not_empty, self._has_items, block, timeout, Empty)
+            result = super().dequeue()
+            self._not_full.notify()
+            return result
+
+    def dequeue_many(self, n, block=True, timeout=None):
+        # Waits for at least one item, then takes up to n in one go.
+        with self._not_empty:
+            self._wait_for(self._not_empty, self._has_items, block, timeout, Empty)
+            results = []
+            curr = self.head
+            while curr and len(results) < n:
+                results.append(curr.value)
+                curr = curr.next
+            self.head = curr
+            if curr is None:
+                self.tail = None
+            self.size -= len(results)
+            self._not_full.notify(len(results))
+            return results
+
+cq = ConcurrentNodeQueue(maxsize=100)
+producers = [threading.Thread(target=cq.extend, args=(range(i * 50, (i + 1) * 50),)) for i in range(4)]
+for producer in producers:
+    producer.start()
+received = []
+while len(received) < 200:
+    received += cq.dequeue_many(32, timeout=1)
+for producer in producers:
+    producer.join()
+print(len(received), sorted(received) == list(range(200)))
+
+"""
+Threads aren't the only way to run producers and consumers side by side. With asyncio, everything
+runs on one thread and tasks take turns at each 'await'. A queue there shouldn't block the thread
+(that would freeze every task) - instead get() and put() are coroutines that SUSPEND the waiting task
+until there's an item or some room.
+
+AsyncDeque is built on our block-linked Deque, and AsyncQueue is just the FIFO subset of it
+(put at the rear, get from the front) - so it serves as the async NodeQueue/Queue too.
+
+Fairness: waiting tasks line up in their own FIFO queue of futures. When an item arrives and
+someone is waiting, it's handed STRAIGHT to the task that has waited longest, rather than waking it
+up to try again (where a newcomer could sneak in and take the item first). Waiting putters are let
+in the same way, oldest first, as soon as there's room.
+
+get_many(n) waits for at least one item, then takes up to n that are already there without
+awaiting again. A consumer that's falling behind then grabs a whole batch per wakeup instead of
+paying a task switch per item.
+"""
+
+import asyncio
+
+class AsyncDeque:
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize  # 0 means unbounded
+        self._items = Deque()
+        self._getters = Deque()  # (future, from_front), oldest at the front
+        self._putters = Deque()  # (future, item, to_front), oldest at the front
+
+    def __repr__(self):
+        return f"{type(self).__name__}{list(self._items)}"
+
+    def __len__(self):
+        return self._items.size()
+
+    def size(self):
+        return self._items.size()
+
+    def is_empty(self):
+        return self._items.is_empty()
+
+    def full(self):
+        return 0 < self.maxsize <= self._items.size()
+
+    def _push(self, item, to_front):
+        # If anyone is waiting the deque must be empty, so hand the item straight over.
+        while not self._getters.is_empty():
+            getter, _ = self._getters.remove_front()
+            if not getter.done():  # Skip waiters that were cancelled
+                getter.set_result(item)
+                return
+        if to_front:
+            self._items.add_front(item)
+        else:
+            self._items.add_rear(item)
+
+    @staticmethod
+    def _forget(waiters, future):
+        # Our Deque has no remove(), so rebuild it without the cancelled waiter (asyncio.Queue's
+        # list.remove is O(waiters) as well).
+        kept = Deque()
+        for waiter in waiters:  # Rear to front, so add_front keeps the order
+            if waiter[0] is not future:
+                kept.add_front(waiter)
+        return kept
+
+    def _admit_putters(self):
+        while not self._putters.is_empty() and not self.full():
+            putter, item, to_front = self._putters.remove_front()
+            if not putter.done():
+                self._push(item, to_front)
+                putter.set_result(None)
+
+    def _take(self, from_front):
+        item = self._items.remove_front() if from_front else self._items.remove_rear()
+        self._admit_putters()
+        return item
+
+    def _put_nowait(self, item, to_front):
+        if self.full():
+            raise asyncio.QueueFull
+        self._push(item, to_front)
+
+    async def _put(self, item, to_front):
+        if not self.full():
+            return self._push(item, to_front)
+        putter = asyncio.get_running_loop().create_future()
+        self._putters.add_rear((putter, item, to_front))
+        try:
+            await putter
+        except asyncio.CancelledError:
+            if not putter.done() or putter.cancelled():  # Still queued, so take it out of the line
+                self._putters = self._forget(self._putters, putter)
+            raise
+
+    def _get_nowait(self, from_front):
+        if self._items.is_empty():
+            raise asyncio.QueueEmpty
+        return self._take(from_front)
+
+    async def _get(self, from_front):
+        if not self._items.is_empty():
+            return self._take(from_front)
+        getter = asyncio.get_running_loop().create_future()
+        self._getters.add_rear((getter, from_front))
+        try:
+            return await getter
+        except asyncio.CancelledError:
+            if getter.done() and not getter.cancelled():
+                # We were handed an item but cancelled before we could use it - give it back.
+                self._push(getter.result(), from_front)
+            else:  # Timed out or cancelled while still waiting - don't leave it in the line
+                self._getters = self._forget(self._getters, getter)
+            raise
+
+    async def _get_many(self, n, from_front):
+        batch = [await self._get(from_front)]
+        remove = self._items.remove_front if from_front else self._items.remove_rear
+        while len(batch) < n and not self._items.is_empty():
+            batch.append(remove())
+        self._admit_putters()
+        return batch
+
+    async def put_front(self, item):
+        await self._put(item, True)
+
+    async def put_rear(self, item):
+        await self._put(item, False)
+
+    def put_front_nowait(self, item):
+        self._put_nowait(item, True)
+
+    def put_rear_nowait(self, item):
+        self._put_nowait(item, False)
+
+    async def get_front(self):
+        return await self._get(True)
+
+    async def get_rear(self):
+        return await self._get(False)
+
+    def get_front_nowait(self):
+        return self._get_nowait(True)
+
+    def get_rear_nowait(self):
+        return self._get_nowait(False)
+
+    async def get_many_front(self, n):
+        return await self._get_many(n, True)
+
+    async def get_many_rear(self, n):
+        return await self._get_many(n, False)
+
+class AsyncQueue(AsyncDeque):
+    async def put(self, item):
+        await self._put(item, False)
+
+    def put_nowait(self, item):
+        self._put_nowait(item, False)
+
+    async def get(self):
+        return await self._get(True)
+
+    def get_nowait(self):
+        return self._get_nowait(True)
+
+    async def get_many(self, n):
+        return await self._get_many(n, True)
+
+async def async_queue_demo():
+    aq = AsyncQueue(maxsize=4)
+
+    async def producer():
+        for i in range(10):
+            await aq.put(i)  # Waits whenever 4 items are already queued
+
+    producing = asyncio.create_task(producer())
+    received = []
+    while len(received) < 10:
+        received += await aq.get_many(3)
+    await producing
+    print(received)
+
+    ad = AsyncDeque()
+    ad.put_rear_nowait("b")
+    await ad.put_front("a")
+    await ad.put_rear("c")
+    print(await ad.get_front(), await ad.get_rear(), ad)  # Expected: a c AsyncDeque['b']
+
+try:
+    asyncio.get_running_loop()
+except RuntimeError:  # asyncio.run() can't start a second loop, so only run the demo if there isn't one
+    asyncio.run(async_queue_demo())
+
+"""
 Next up: DoublyLinkedList.
 """
 
@@ -949,21 +2355,81 @@ class DNode:
     def prev(self, prev):
         self._prev = prev
 
+class SlotDNode:
+    __slots__ = ("value", "next", "prev")
+
+    def __init__(self, value):
+        self.value = value
+        self.next = self.prev = None
+
+    def __repr__(self):
+        return f"Node({self.value})"
+
+"""
+Random access into a linked list is always a walk. But with a doubly linked list we can at least
+walk from whichever end is closer - so index(i) and pop(i) never walk more than size/2 nodes.
+
+Better still, the list remembers the last node it walked to (a FINGER) along with its index.
+Accesses usually land near the previous one (think going through a document line by line), so
+the next index()/pop() can start from the finger and only take a step or two.
+
+For sequential edits there's an even simpler tool: a CURSOR. It holds on to one node and does
+everything relative to it - move forward/back, insert next to it, delete it - all O(1), since
+every node already knows both its neighbours. Just like the text cursor in an editor.
+A cursor can sit one past the tail (at_end) so you can insert at the very end too.
+Don't keep using a cursor whose node has been removed some other way.
+"""
+
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, compact=False):
         self.head = self.tail = None
         self.size = 0
+        self._node = SlotDNode if compact else DNode
+        self._finger = None  # (node, index) of the last positional access
+
+    @classmethod
+    def from_iterable(cls, iterable, compact=False):
+        linked_list = cls(compact)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def extend(self, iterable):
+        # Build the new segment off to the side, then splice it on with two pointer changes.
+        first, last, count = _build_chain(self._node, iterable, doubly=True)
+        if not count:
+            return
+        if self.tail:
+            self.tail.next = first
+            first.prev = self.tail
+        else:
+            self.head = first
+        self.tail = last
+        self.size += count
     
-    def __repr__(self):
-        values = []
+    def __iter__(self):
         curr = self.head
         while curr:
-            values.append(str(curr.value))
+            yield curr.value
             curr = curr.next
-        return ", ".join(values) if values else "DoublyLinkedList is empty."
+
+    def __reversed__(self):
+        # Only possible in O(n) because every node knows its prev.
+        curr = self.tail
+        while curr:
+            yield curr.value
+            curr = curr.prev
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, item):
+        return self.search(item)
+
+    def __repr__(self):
+        return ", ".join(str(value) for value in self) if self.size else "DoublyLinkedList is empty."
     
     def prepend(self, item):
-        new_node = DNode(item)
+        new_node = self._node(item)
         if not self.head:
             self.head = self.tail = new_node
         else:
@@ -971,9 +2437,12 @@ class DoublyLinkedList:
             self.head.prev = new_node
             self.head = new_node
         self.size += 1
+        if self._finger:
+            node, idx = self._finger
+            self._finger = (node, idx + 1)
     
     def append(self, item):
-        new_node = DNode(item)
+        new_node = self._node(item)
         if not self.tail:
             self.head = self.tail = new_node
         else:
@@ -991,6 +2460,53 @@ class DoublyLinkedList:
 
         return False
 
+    def _node_at(self, idx):
+        # Start from the head, the tail or the finger - whichever is closest to idx.
+        start, start_idx = self.head, 0
+        if self.size - 1 - idx < idx:
+            start, start_idx = self.tail, self.size - 1
+        if self._finger and abs(self._finger[1] - idx) < abs(start_idx - idx):
+            start, start_idx = self._finger
+
+        curr = start
+        for _ in range(idx - start_idx):
+            curr = curr.next
+        for _ in range(start_idx - idx):
+            curr = curr.prev
+        self._finger = (curr, idx)
+        return curr
+
+    def _link_before(self, node, new_node):
+        # Links new_node in front of node (or at the tail if node is None).
+        if node is None:
+            new_node.prev = self.tail
+            if self.tail:
+                self.tail.next = new_node
+            else:
+                self.head = new_node
+            self.tail = new_node
+        else:
+            new_node.prev = node.prev
+            new_node.next = node
+            if node.prev:
+                node.prev.next = new_node
+            else:
+                self.head = new_node
+            node.prev = new_node
+        self.size += 1
+
+    def _unlink(self, curr):
+        if curr.prev:
+            curr.prev.next = curr.next
+        else:
+            self.head = curr.next  # Removing head
+
+        if curr.next:
+            curr.next.prev = curr.prev
+        else:
+            self.tail = curr.prev  # Removing tail
+        self.size -= 1
+
     def index(self, idx):
         if idx < 0:
             raise IndexError("Can't have negative index.")
@@ -998,13 +2514,7 @@ class DoublyLinkedList:
             raise IndexError("List is empty.")
         if idx >= self.size:
             raise IndexError(f"Index {idx} out of range for size {self.size}.")
-        
-        curr = self.head
-        curr_idx = 0
-        while curr_idx != idx:
-            curr = curr.next
-            curr_idx += 1
-        return curr.value            
+        return self._node_at(idx).value
 
     def remove(self, item):
         if not self.head:
@@ -1013,17 +2523,8 @@ class DoublyLinkedList:
         curr = self.head
         while curr:
             if curr.value == item:
-                if curr.prev:
-                    curr.prev.next = curr.next
-                else:
-                    self.head = curr.next  # Removing head
-
-                if curr.next:
-                    curr.next.prev = curr.prev
-                else:
-                    self.tail = curr.prev  # Removing tail
-
-                self.size -= 1
+                self._unlink(curr)
+                self._finger = None
                 return True
             curr = curr.next
 
@@ -1032,23 +2533,87 @@ class DoublyLinkedList:
     def pop(self, idx=None):
         if not self.head:
             raise IndexError("List is empty.")
+        if idx is None:
+            idx = -1
         if idx < 0:
             idx = self.size + idx
         if idx < 0 or idx >= self.size:
             raise IndexError("Index out of range.")
         
-        curr = self.head
-        for _ in range(idx):
-            curr = curr.next
-
-        if curr.prev:
-            curr.prev.next = curr.next
-        else:
-            self.head = curr.next
+        curr = self._node_at(idx)
+        self._unlink(curr)
+        # Keep the finger on the node that slid into position idx (or the one before it).
         if curr.next:
-            curr.next.prev = curr.prev
+            self._finger = (curr.next, idx)
+        elif curr.prev:
+            self._finger = (curr.prev, idx - 1)
         else:
-            self.tail = curr.prev
+            self._finger = None
+        return curr.value
 
-        self.size -= 1
-        return curr.value
\ No newline at end of file
+    def cursor(self, idx=0):
+        if idx < 0 or idx > self.size:
+            raise IndexError(f"Index {idx} out of range for size {self.size}.")
+        return Cursor(self, self._node_at(idx) if idx < self.size else None)
+
+class Cursor:
+    def __init__(self, linked_list, node):
+        self._list = linked_list
+        self._node = node  # None means one past the tail
+
+    def __repr__(self):
+        return f"Cursor({self._node.value if self._node else 'end'})"
+
+    @property
+    def value(self):
+        if self._node is None:
+            raise IndexError("Cursor is at the end of the list.")
+        return self._node.value
+
+    @value.setter
+    def value(self, value):
+        if self._node is None:
+            raise IndexError("Cursor is at the end of the list.")
+        self._node.value = value
+
+    def at_end(self):
+        return self._node is None
+
+    def move_next(self):
+        if self._node is None:
+            raise IndexError("Cursor is already at the end of the list.")
+        self._node = self._node.next
+
+    def move_prev(self):
+        prev = self._list.tail if self._node is None else self._node.prev
+        if prev is None:
+            raise IndexError("Cursor is already at the start of the list.")
+        self._node = prev
+
+    def insert_before(self, item):
+        self._list._link_before(self._node, self._list._node(item))
+        self._list._finger = None
+
+    def insert_after(self, item):
+        if self._node is None:
+            raise IndexError("Cursor is at the end of the list.")
+        self._list._link_before(self._node.next, self._list._node(item))
+        self._list._finger = None
+
+    def delete(self):
+        # Removes the node under the cursor, and moves on to the next one.
+        if self._node is None:
+            raise IndexError("Cursor is at the end of the list.")
+        node = self._node
+        self._list._unlink(node)
+        self._list._finger = None
+        self._node = node.next
+        return node.value
+
+dll = DoublyLinkedList.from_iterable(["a", "b", "c", "d"])
+print(dll.index(3), dll.pop(2), dll.pop())  # Expected: d c d
+cur = dll.cursor(1)
+cur.insert_before("x")
+cur.insert_after("y")
+cur.move_next()
+print(cur.delete(), dll)  # Expected: y a, x, b
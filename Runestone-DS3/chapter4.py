@@ -97,6 +97,11 @@ def to_str(n, base):
 print(to_str(1453, 16))
 print(to_str(100, 10))
 
+"""
+Note convert_base recurses once per digit, so anything past ~1000 digits hits the recursion limit.
+base_conversion.py does the same job for bases 2-36 by recursing on halves of the number instead.
+"""
+
 """
 This example gives an insight onto what we call the STACK FRAME.
 The stack frame is essentially what Python uses to handle the local variables of a function.
@@ -146,6 +151,11 @@ assert is_pal(remove_white("")) is True
 assert is_pal(remove_white("hannah")) is True
 assert is_pal(remove_white("madam i'm adam")) is True
 
+"""
+Cute, but every s[1:-1] copies the string, so this is O(n^2) and falls over past the recursion limit.
+palindromes.py has the two-pointer version (plus batches and Manacher's longest palindrome).
+"""
+
 """
 Before we get to the next part here, just adding a big note here on ENVIRONMENTS.
 
@@ -746,6 +756,12 @@ def make_change_tab(coin_value_list, change):
 print(make_change_tab([1, 5, 10, 25], 42))
 print(dp)
 
+"""
+(This make_change_tab shadows the one above, and only works up to 42 because of the global dp.
+coin_change.py has a CoinChange class that keeps its own table, gives back the actual coins, answers
+lots of targets from one table, and counts the number of ways too.)
+"""
+
 """
 The last thing I wanna leave here is that if you think a bit more abstractly about
 DP with memoization vs tabulation, they're both very similar in concept to the
@@ -1021,5 +1037,9 @@ recursion fairy can solve the previous recurrence magically. I.e. assume that
 dp[i-1] or dp[w-weight] can and will be returned correctly. How would you then
 create the recurrence with that assumption?
 
+One more thing: that inner loop over w is the slow part in Python, but each item's update is just
+"the whole row, shifted right by weight, plus value, maxed with itself". knapsack.py does exactly
+that with NumPy, one vectorised operation per item.
+
 That concludes chapter 4.
 """
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""
+The coin change problem from chapter 4, as something you can actually use.
+
+chapter 4 ends up with make_change_dnc (exponential), make_change_2 (memoized, with the caller
+passing in the table) and two make_change_tab's that shadow each other and keep their state in the
+globals operations/dp. They also only ever give back the NUMBER of coins.
+
+CoinChange owns its tables instead. It's the same bottom-up tabulation as make_change_tab, but next
+to fewest[amount] it also remembers which coin got us there (last[amount]), so the actual coins come
+out by just following last[] back down to 0. Both tables are array('q')s, so they're compact and
+NumPy can read them without copying.
+
+Because the table covers EVERY amount up to the biggest one asked for, one solver answers any
+number of smaller targets with plain lookups - build once, then each query is O(1) for the count and
+O(number of coins) for the coins themselves. Asking for a bigger amount just carries on filling the
+table from where it stopped.
+
+count_ways is the other classic question: how many different combinations of coins (order doesn't
+matter) add up to the amount. Row i of that table only uses the first i coins, so every combination
+is counted once.
+
+A warm table is worth keeping around, so save() writes it to a file and load() MEMORY-MAPS it back:
+the OS pages it in as it's read, so a restarted process gets every old answer without recomputing
+or even reading the whole file up front. Only extending past the saved amount copies it into memory.
+
+CoinChangeCache holds one solver per set of denominations, keyed by the sorted coin tuple. Once the
+tables add up to more than max_bytes, the least recently used solvers get dropped - or, if it has a
+directory, saved there first and memory-mapped back in when those coins come up again.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter, OrderedDict
+
+from _numpy_support import is_numpy_array
+
+IMPOSSIBLE = -1
+FILE_MAGIC = b"COINCHG1"
+_HEADER = struct.Struct("<8sqq")  # magic, number of coins, table length
+
+
+class CoinChange:
+    def __init__(self, coin_value_list, max_change=0):
+        coins = tuple(sorted(set(coin_value_list)))
+        if not coins or coins[0] <= 0 or not all(isinstance(coin, int) for coin in coins):
+            raise ValueError("Coins must be positive whole numbers.")
+        self._coins = coins
+        self._fewest = array("q", [0])  # fewest[amount], or IMPOSSIBLE
+        self._last = array("q", [0])  # The coin used to make the last step to amount
+        self._ways = None  # Built on the first count_ways call
+        self._mmap = None  # Set when the tables are views into a loaded file
+        self.extend(max_change)
+
+    @property
+    def coins(self):
+        return self._coins
+
+    @property
+    def max_change(self):
+        return len(self._fewest) - 1
+
+    @property
+    def nbytes(self):
+        # Roughly what the tables take up - the ways table holds Python ints, so that part is a guess.
+        size = len(self._fewest) * 16
+        if self._ways is not None:
+            size += sum(sys.getsizeof(row) + 28 * len(row) for row in self._ways)
+        return size
+
+    def extend(self, change):
+        if change >= len(self._fewest) and self._mmap is not None:
+            self._detach()
+        fewest, last, coins = self._fewest, self._last, self._coins
+        for amount in range(len(fewest), change + 1):
+            best, best_coin = IMPOSSIBLE, 0
+            for coin in coins:
+                if coin > amount:
+                    break  # Coins are sorted, so the rest are too big as well
+                prev = fewest[amount - coin]
+                if prev != IMPOSSIBLE and (best == IMPOSSIBLE or prev + 1 < best):
+                    best, best_coin = prev + 1, coin
+            fewest.append(best)
+            last.append(best_coin)
+
+    def fewest_coins(self, change):
+        # Same answer as make_change_tab: the number of coins, or -1 if it can't be done.
+        if change < 0:
+            return IMPOSSIBLE
+        self.extend(change)
+        return self._fewest[change]
+
+    def make_change(self, change):
+        # The coins themselves, biggest first, or None if it can't be done.
+        if self.fewest_coins(change) == IMPOSSIBLE:
+            return None
+        coins = []
+        while change:
+            coin = self._last[change]
+            coins.append(coin)
+            change -= coin
+        coins.sort(reverse=True)
+        return coins
+
+    def coin_counts(self, change):
+        coins = self.make_change(change)
+        return None if coins is None else Counter(coins)
+
+    def fewest_coins_many(self, targets):
+        # A list for a list, or a NumPy int64 array for a NumPy array (looked up in one go).
+        if is_numpy_array(targets):
+            import numpy as np
+
+            targets = np.asarray(targets, dtype=np.int64)
+            if targets.size:
+                self.extend(int(targets.max()))
+            table = np.frombuffer(self._fewest, dtype=np.int64)
+            return np.where(targets < 0, IMPOSSIBLE, table[np.clip(targets, 0, None)])
+        targets = list(targets)
+        if targets:
+            self.extend(max(targets))
+        return [self.fewest_coins(change) for change in targets]
+
+    def make_change_many(self, targets):
+        targets = list(targets)
+        if targets:
+            self.extend(max(targets))
+        return [self.make_change(change) for change in targets]
+
+    def count_ways(self, change):
+        if change < 0:
+            return 0
+        if self._ways is None:
+            self._ways = [[1] for _ in self._coins]
+        ways = self._ways
+        for amount in range(len(ways[0]), change + 1):
+            below = 0  # Ways using none of the coins so far (0 for anything but amount 0)
+            for coin, row in zip(self._coins, ways):
+                below += row[amount - coin] if coin <= amount else 0
+                row.append(below)
+        return ways[-1][change]
+
+    def count_ways_many(self, targets):
+        targets = list(targets)
+        if targets:
+            self.count_ways(max(targets))
+        return [self.count_ways(change) for change in targets]
+
+    def save(self, path):
+        header = _HEADER.pack(FILE_MAGIC, len(self._coins), len(self._fewest))
+        temp = f"{path}.tmp"
+        with open(temp, "wb") as f:
+            f.write(header)
+            f.write(array("q", self._coins).tobytes())
+            f.write(bytes(self._fewest))
+            f.write(bytes(self._last))
+        os.replace(temp, path)  # Never leave a half-written table behind
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, num_coins, length = _HEADER.unpack_from(mapped)
+        if magic != FILE_MAGIC:
+            mapped.close()
+            raise ValueError(f"{path} isn't a saved CoinChange table.")
+
+        view = memoryview(mapped)
+        start = _HEADER.size
+        coins = view[start:start + 8 * num_coins].cast("q").tolist()
+        start += 8 * num_coins
+        solver = cls(coins)
+        solver._fewest = view[start:start + 8 * length].cast("q")
+        solver._last = view[start + 8 * length:start + 16 * length].cast("q")
+        solver._mmap = mapped
+        return solver
+
+    def _detach(self):
+        # Copy the mapped tables into arrays we can grow, and let go of the file.
+        fewest, last = array("q"), array("q")
+        fewest.frombytes(self._fewest.cast("B"))
+        last.frombytes(self._last.cast("B"))
+        self._fewest.release()
+        self._last.release()
+        self._fewest, self._last = fewest, last
+        self._mmap.close()
+        self._mmap = None
+
+
+class CoinChangeCache:
+    def __init__(self, max_bytes=64 * 2**20, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._solvers = OrderedDict()  # Least recently used first
+
+    def __len__(self):
+        return len(self._solvers)
+
+    def __contains__(self, coin_value_list):
+        return tuple(sorted(set(coin_value_list))) in self._solvers
+
+    @property
+    def nbytes(self):
+        return sum(solver.nbytes for solver in self._solvers.values())
+
+    def _path(self, coins):
+        return os.path.join(self.directory, "coins_" + "-".join(map(str, coins)) + ".bin")
+
+    def get(self, coin_value_list):
+        coins = tuple(sorted(set(coin_value_list)))
+        solver = self._solvers.get(coins)
+        if solver is not None:
+            self._solvers.move_to_end(coins)
+            return solver
+
+        if self.directory is not None and os.path.exists(self._path(coins)):
+            solver = CoinChange.load(self._path(coins))
+        else:
+            solver = CoinChange(coins)
+        self._solvers[coins] = solver
+        return solver
+
+    def trim(self):
+        # Evict least recently used solvers until we're under budget, always keeping the newest.
+        total = self.nbytes
+        while total > self.max_bytes and len(self._solvers) > 1:
+            coins, solver = self._solvers.popitem(last=False)
+            total -= solver.nbytes
+            if self.directory is not None:
+                solver.save(self._path(coins))
+
+    def fewest_coins(self, coin_value_list, change):
+        result = self.get(coin_value_list).fewest_coins(change)
+        self.trim()
+        return result
+
+    def make_change(self, coin_value_list, change):
+        result = self.get(coin_value_list).make_change(change)
+        self.trim()
+        return result
+
+    def count_ways(self, coin_value_list, change):
+        result = self.get(coin_value_list).count_ways(change)
+        self.trim()
+        return result
+
+
+def make_change(coin_value_list, change):
+    return CoinChange(coin_value_list).make_change(change)
+
+
+if __name__ == "__main__":
+    solver = CoinChange([1, 5, 10, 25])
+    print(solver.fewest_coins(42), solver.make_change(42))  # Expected: 5 [25, 10, 5, 1, 1]
+    print(solver.fewest_coins_many([0, 7, 63, 99]))
+    print(solver.count_ways(100))  # Expected: 242
+    print(make_change([4, 7], 5), make_change([1, 21, 25], 63))  # Greedy would get the second wrong
+
+    cache = CoinChangeCache(max_bytes=2**20)
+    print(cache.make_change((1, 5, 10, 25), 42), cache.make_change([1, 21, 25], 63), len(cache))
@@ -0,0 +1,257 @@
+"""
+0/1 knapsack with NumPy doing the inner loop.
+
+o1_knapsack_tabulation_efficient (chapter 4) keeps one row dp[w] = best value with capacity w, and for
+every item walks w from max_weight down to the item's weight in a Python loop: O(nW) interpreted
+steps, which is already minutes for n = 1000, W = 10^6.
+
+But each item's update is really one whole-row operation:
+
+    dp[w] = max(dp[w], dp[w - weight] + value)    for every w >= weight
+
+i.e. the row shifted right by `weight`, plus `value`, maxed against itself. The backwards loop in
+chapter 4 is only there so dp[w - weight] still holds the OLD row when it's read - with NumPy the
+right hand side is computed in full before anything is written, so that comes for free. That leaves
+n vectorised operations over W+1 entries each.
+
+Items are (weight, value) pairs like in chapter 4. Weights have to be whole numbers, since they index
+the row; values can be ints (the row is int64, or Python ints if the total could overflow that) or
+floats (float64).
+
+o1_knapsack_items also says WHICH items to take. o1_knapsack_tabulation keeps the whole (n+1) x (W+1)
+table of Python ints but only returns the value, and the one-row version couldn't say even if it
+wanted to. Walking back through the choices only needs one bit per item per capacity: "did taking
+item i win at capacity w?". So for each item we keep np.packbits of that comparison - n x W bits,
+64 times smaller than an int64 table - and walk back from w = max_weight, taking item i whenever its
+bit is set and moving to w - weight.
+
+When even the bits would take more than max_decision_bytes, the items are split in half instead
+(Hirschberg's trick): one row for the first half, one for the second, and the best split of the
+capacity between them is the c that maximises first[c] + second[max_weight - c]. Then each half is
+solved on its own share of the capacity, recursively, until the pieces are small enough for bits.
+That's O(W) memory per level, for about log n times the work.
+
+The other variants all come back to the same 0/1 row update:
+
+- bounded_knapsack lets each item be taken up to `quantity` times. Rather than adding the item
+  quantity times, it's split into bundles of 1, 2, 4, 8... copies (plus whatever's left over) - any
+  count up to quantity is a sum of some of those bundles, so log(quantity) 0/1 items cover it.
+- unbounded_knapsack is bounded_knapsack where the quantity is however many could ever fit.
+- knapsack_2d has a weight AND a volume limit, so the row becomes a (W+1) x (V+1) grid, shifted
+  along both axes at once.
+- o1_knapsack_mitm is for few items but a huge (or fractional) capacity, where no table fits in
+  memory. Meet in the middle: list every subset of each half (2^(n/2) each, not 2^n), sort one side
+  by weight with a running best value, and for every subset of the other side binary search for the
+  heaviest partner that still fits.
+
+knapsack() picks between the table and meet in the middle by whichever does less work for this n and W.
+"""
+
+import numpy as np
+
+
+def _check_items(max_weight, items, whole=True):
+    # whole=False is for meet in the middle, the one solver that never uses weights as indices.
+    if max_weight < 0:
+        raise ValueError("max_weight can't be negative.")
+    for weight, _ in items:
+        if weight < 0 or (whole and int(weight) != weight):
+            kind = "non-negative whole numbers" if whole else "non-negative"
+            raise ValueError(f"Weights must be {kind}, not {weight}.")
+
+
+def _value_dtype(items, dtype):
+    if dtype is not None:
+        return np.dtype(dtype)
+    if all(isinstance(value, (int, np.integer)) for _, value in items):
+        if sum(int(value) for _, value in items if value > 0) <= np.iinfo(np.int64).max:
+            return np.dtype(np.int64)
+        return np.dtype(object)  # Could overflow int64, so fall back to (slow but exact) Python ints
+    return np.dtype(np.float64)
+
+
+def _plain(value):
+    # NumPy scalar -> Python number; object rows already hold Python ints.
+    return value.item() if isinstance(value, np.generic) else value
+
+
+MAX_DECISION_BYTES = 2**28
+
+
+def _best_row(max_weight, items, dtype, decisions=None):
+    # dp[w] for every capacity w. With a decisions list, also appends each item's packed "taken" bits.
+    dp = np.zeros(max_weight + 1, dtype=dtype)
+    shifted = np.empty_like(dp)  # Reused for every item instead of a fresh temporary each time
+
+    for weight, value in items:
+        weight = int(weight)
+        width = max_weight + 1 - weight
+        np.add(dp[:width], value, out=shifted[:width])  # Value of taking the item, from the old row
+        if decisions is not None:
+            decisions.append(np.packbits(shifted[:width] > dp[weight:]))
+        np.maximum(dp[weight:], shifted[:width], out=dp[weight:])
+    return dp
+
+
+def _useful(max_weight, items):
+    # (index, weight, value) for the items that fit and are worth something - nothing else gets taken.
+    return [(i, int(weight), value) for i, (weight, value) in enumerate(items) if weight <= max_weight and value > 0]
+
+
+def o1_knapsack(max_weight, items, dtype=None):
+    _check_items(max_weight, items)
+    max_weight = int(max_weight)  # Weights are whole numbers, so a fractional capacity is as good as its floor
+    useful = [(weight, value) for _, weight, value in _useful(max_weight, items)]
+    return _plain(_best_row(max_weight, useful, _value_dtype(items, dtype))[max_weight])
+
+
+def _choose_with_bits(max_weight, useful, dtype):
+    decisions = []
+    _best_row(max_weight, [(weight, value) for _, weight, value in useful], dtype, decisions)
+    chosen = []
+    w = max_weight
+    for (index, weight, _), bits in zip(reversed(useful), reversed(decisions)):
+        offset = w - weight
+        if offset >= 0 and bits[offset >> 3] >> (7 - (offset & 7)) & 1:
+            chosen.append(index)
+            w = offset
+    return chosen
+
+
+def _choose(max_weight, useful, dtype, max_decision_bytes):
+    useful = [item for item in useful if item[1] <= max_weight]
+    if not useful:
+        return []
+    if len(useful) == 1 or sum(max_weight + 1 - weight for _, weight, _ in useful) <= 8 * max_decision_bytes:
+        return _choose_with_bits(max_weight, useful, dtype)
+
+    middle = len(useful) // 2
+    first, second = useful[:middle], useful[middle:]
+    first_row = _best_row(max_weight, [(weight, value) for _, weight, value in first], dtype)
+    second_row = _best_row(max_weight, [(weight, value) for _, weight, value in second], dtype)
+    split = int(np.argmax(first_row + second_row[::-1]))  # first gets `split`, second gets the rest
+    del first_row, second_row
+    return (_choose(split, first, dtype, max_decision_bytes)
+            + _choose(max_weight - split, second, dtype, max_decision_bytes))
+
+
+def o1_knapsack_items(max_weight, items, dtype=None, max_decision_bytes=MAX_DECISION_BYTES):
+    # (best value, indices of the items to take), with the indices in increasing order.
+    _check_items(max_weight, items)
+    max_weight = int(max_weight)
+    chosen = sorted(_choose(max_weight, _useful(max_weight, items), _value_dtype(items, dtype), max_decision_bytes))
+    return sum(items[i][1] for i in chosen), chosen
+
+
+MITM_MAX_ITEMS = 40
+MAX_TABLE_SIZE = 2**30  # Entries in one dp row - 8 GiB of int64 already
+
+
+def _subset_sums(weights, values):
+    # Weight and value of every subset; subset number m takes item j when bit j of m is set.
+    subset_weights = np.zeros(1, dtype=weights.dtype)
+    subset_values = np.zeros(1, dtype=values.dtype)
+    for weight, value in zip(weights, values):
+        subset_weights = np.concatenate([subset_weights, subset_weights + weight])
+        subset_values = np.concatenate([subset_values, subset_values + value])
+    return subset_weights, subset_values
+
+
+def o1_knapsack_mitm(max_weight, items, dtype=None):
+    _check_items(max_weight, items, whole=False)
+    useful = [(weight, value) for weight, value in items if weight <= max_weight and value > 0]
+    if len(useful) > MITM_MAX_ITEMS:
+        raise ValueError(f"Meet in the middle needs 2^(n/2) memory, so at most {MITM_MAX_ITEMS} useful items.")
+    if not useful:
+        return 0
+
+    weights = np.array([weight for weight, _ in useful])
+    values = np.array([value for _, value in useful], dtype=_value_dtype(useful, dtype))
+    middle = len(useful) // 2
+    left_weights, left_values = _subset_sums(weights[:middle], values[:middle])
+    right_weights, right_values = _subset_sums(weights[middle:], values[middle:])
+
+    order = np.argsort(right_weights, kind="stable")
+    right_weights = right_weights[order]
+    right_best = np.maximum.accumulate(right_values[order])  # Best value at or under each weight
+
+    fits = left_weights <= max_weight
+    partner = np.searchsorted(right_weights, max_weight - left_weights[fits], side="right") - 1
+    return _plain((left_values[fits] + right_best[partner]).max())  # partner >= 0: the empty subset fits
+
+
+def knapsack(max_weight, items, dtype=None):
+    # 0/1 knapsack by whichever of the table or meet in the middle should be quicker.
+    _check_items(max_weight, items, whole=False)
+    useful = [(weight, value) for weight, value in items if weight <= max_weight and value > 0]
+    n = len(useful)
+    if all(int(weight) == weight for weight, _ in useful):
+        table_work = n * (int(max_weight) + 1)
+    else:
+        table_work = float("inf")  # Fractional weights can't index a table
+    mitm_work = n * 2 ** ((n + 1) // 2) if n <= MITM_MAX_ITEMS else float("inf")
+
+    if table_work == mitm_work == float("inf"):
+        raise ValueError(f"Fractional weights only work with at most {MITM_MAX_ITEMS} items.")
+    if mitm_work <= table_work:
+        return o1_knapsack_mitm(max_weight, items, dtype)
+    if max_weight >= MAX_TABLE_SIZE:
+        raise ValueError(f"Too many items for meet in the middle, and a table for max_weight {max_weight} "
+                         f"would need more than {MAX_TABLE_SIZE} entries.")
+    # With whole-number weights, a fractional capacity is as good as its floor.
+    return o1_knapsack(int(max_weight), useful, _value_dtype(items, dtype))
+
+
+def _bundles(max_weight, items):
+    # Binary splitting: quantity q becomes 0/1 bundles of 1, 2, 4, ... copies and the remainder.
+    for weight, value, quantity in items:
+        if weight > 0:
+            limit = int(max_weight // weight)
+            quantity = limit if quantity is None else min(quantity, limit)
+        elif quantity is None:
+            if value > 0:
+                raise ValueError("An unlimited item with no weight makes the value unbounded.")
+            continue
+        size = 1
+        while quantity > 0:
+            take = min(size, quantity)
+            yield weight * take, value * take
+            quantity -= take
+            size *= 2
+
+
+def bounded_knapsack(max_weight, items, dtype=None):
+    # Items are (weight, value, quantity); a quantity of None means as many as you like.
+    return knapsack(max_weight, list(_bundles(max_weight, items)), dtype)  # Bundle totals pick the dtype
+
+
+def unbounded_knapsack(max_weight, items, dtype=None):
+    return bounded_knapsack(max_weight, [(weight, value, None) for weight, value in items], dtype)
+
+
+def knapsack_2d(max_weight, max_volume, items, dtype=None):
+    # Items are (weight, volume, value), and both limits have to hold.
+    _check_items(max_weight, [(weight, value) for weight, _, value in items])
+    _check_items(max_volume, [(volume, value) for _, volume, value in items])
+    max_weight, max_volume = int(max_weight), int(max_volume)
+    dp = np.zeros((max_weight + 1, max_volume + 1), dtype=_value_dtype([item[1:] for item in items], dtype))
+    shifted = np.empty_like(dp)
+
+    for weight, volume, value in items:
+        weight, volume = int(weight), int(volume)
+        if weight > max_weight or volume > max_volume or value <= 0:
+            continue
+        rows, cols = max_weight + 1 - weight, max_volume + 1 - volume
+        np.add(dp[:rows, :cols], value, out=shifted[:rows, :cols])
+        np.maximum(dp[weight:, volume:], shifted[:rows, :cols], out=dp[weight:, volume:])
+
+    return _plain(dp[max_weight, max_volume])
+
+
+if __name__ == "__main__":
+    items = [(2, 3), (3, 4), (4, 8), (5, 8), (9, 10)]
+    print(o1_knapsack(20, items))  # Expected: 29, same as chapter 4
+    print(o1_knapsack(20, [(2, 3.5), (3, 4.25), (4, 8.0), (5, 8.0), (9, 10.5)]))
+    print(o1_knapsack_items(20, items))  # Expected: (29, [0, 2, 3, 4]) - everything but (3, 4)
+    print(o1_knapsack_mitm(20, items), knapsack(10**12, items), unbounded_knapsack(20, items))  # 29 33 40
+    print(bounded_knapsack(20, [(4, 8, 2), (5, 8, 3), (2, 3, 1)]), knapsack_2d(20, 10, [(w, w // 2, v) for w, v in items]))
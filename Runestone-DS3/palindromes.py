@@ -0,0 +1,106 @@
+"""
+Palindrome checking without copying the string around.
+
+palindrome_checker and palindrome_checker_spaces (chapter 3) push every character onto a Deque first,
+and is_pal (chapter 4) slices s[1:-1] on every call - O(n^2) copying, and a RecursionError for any
+string longer than the recursion limit. None of that is needed: keep one index at each end and walk
+them towards each other. Skipping non-letters and ignoring case happen as the indices move, so the
+string is never rebuilt, and a mismatch near the ends (the usual case) returns straight away. The one
+exception is ignore_case on non-ASCII text: casefolding can change the length ('ß' -> 'ss', 'ﬃ' ->
+'ffi'), so that string is normalised as a whole first - the same rule are_palindromes uses.
+
+are_palindromes checks a whole batch. There each string is normalised with str methods that run in C
+(translate to drop ASCII non-letters, casefold) and compared with its reverse, which beats walking
+two indices in Python once most of the strings have to be read all the way through.
+
+longest_palindrome is Manacher's algorithm: O(n) rather than trying every centre, because a
+palindrome centred inside a bigger palindrome mirrors one we've already measured on the other side.
+"""
+
+
+def is_palindrome(text, ignore_case=False, alpha_only=False):
+    if ignore_case and not text.isascii():
+        # Per character would miss letters that casefold to several, so normalise it like are_palindromes
+        text, ignore_case, alpha_only = _normalise(text, True, alpha_only), False, False
+    left, right = 0, len(text) - 1
+    while left < right:
+        a, b = text[left], text[right]
+        if alpha_only and not a.isalpha():
+            left += 1
+            continue
+        if alpha_only and not b.isalpha():
+            right -= 1
+            continue
+        if a != b and not (ignore_case and a.casefold() == b.casefold()):
+            return False
+        left += 1
+        right -= 1
+    return True
+
+
+# Deletes every ASCII character that isn't a letter, in one C-level pass.
+_ASCII_NON_LETTERS = dict.fromkeys(c for c in range(128) if not chr(c).isalpha())
+
+
+def _normalise(text, ignore_case, alpha_only):
+    if alpha_only:
+        if text.isascii():
+            text = text.translate(_ASCII_NON_LETTERS)
+        else:
+            text = "".join(filter(str.isalpha, text))
+    if ignore_case:
+        text = text.casefold()
+    return text
+
+
+def are_palindromes(texts, ignore_case=False, alpha_only=False):
+    # A list of bools for any iterable of strings (NumPy string arrays included).
+    checked = []
+    for text in texts:
+        text = _normalise(text, ignore_case, alpha_only)
+        checked.append(text == text[::-1])
+    return checked
+
+
+def longest_palindrome(text):
+    n = len(text)
+    if n == 0:
+        return ""
+    # odd[i]: how far the odd-length palindrome centred on i reaches (it covers 2*odd[i] - 1 chars).
+    # even[i]: the same for the even-length one whose right half starts at i (2*even[i] chars).
+    odd = [0] * n
+    even = [0] * n
+    best_start, best_length = 0, 1
+
+    left, right = 0, -1  # The rightmost-reaching palindrome found so far is text[left:right+1]
+    for i in range(n):
+        radius = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - radius >= 0 and i + radius < n and text[i - radius] == text[i + radius]:
+            radius += 1
+        odd[i] = radius
+        if i + radius - 1 > right:
+            left, right = i - radius + 1, i + radius - 1
+        if 2 * radius - 1 > best_length:
+            best_start, best_length = i - radius + 1, 2 * radius - 1
+
+    left, right = 0, -1
+    for i in range(n):
+        radius = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - radius - 1 >= 0 and i + radius < n and text[i - radius - 1] == text[i + radius]:
+            radius += 1
+        even[i] = radius
+        if i + radius - 1 > right:
+            left, right = i - radius, i + radius - 1
+        if 2 * radius > best_length:
+            best_start, best_length = i - radius, 2 * radius
+
+    return text[best_start:best_start + best_length]
+
+
+if __name__ == "__main__":
+    print(is_palindrome("detartrated"), is_palindrome("radsa"))
+    print(is_palindrome("Madam I'm Adam", ignore_case=True, alpha_only=True))
+    print(are_palindromes(["I PREFER PI", "hello", "Step on no pets"], ignore_case=True, alpha_only=True))
+    for text in ("ﬃ", "sß", "İi"):  # Casefolding changes the length of these
+        assert is_palindrome(text, ignore_case=True) == are_palindromes([text], ignore_case=True)[0]
+    print(longest_palindrome("forgeeksskeegfor"))  # Expected: geeksskeeg
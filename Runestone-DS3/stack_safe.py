@@ -0,0 +1,84 @@
+"""
+Drop-in versions of the chapter 4 recursive helpers that don't recurse.
+
+reverse_str, reversal_recursive and is_pal slice their input on every call, so a string or list of
+length n gets copied n times - O(n^2) - and anything longer than sys.getrecursionlimit() (1000 by
+default) raises RecursionError. factorial_recursive doesn't slice, but it hits the same limit.
+(list_sum_rec actually hands num_list[1:] to the loop version, so it only recurses once - but it
+still copies the whole list to do it.) The versions here take the same arguments and give the same
+answers in a single pass, and empty inputs give 0 / "" / True instead of blowing up.
+
+For recursion that doesn't flatten into a loop so easily there's the trampoline decorator. Write the
+function as a generator and, instead of calling itself, YIELD the recursive call:
+
+    @trampoline
+    def depth(tree):
+        if not tree:
+            return 0
+        return 1 + max((yield depth.defer(tree.left)), (yield depth.defer(tree.right)))
+
+The decorator keeps the pending calls on an ordinary list and sends each result back into the
+generator that asked for it, so the C stack never grows no matter how deep the recursion goes.
+"""
+
+import math
+from functools import wraps
+
+from palindromes import is_palindrome
+
+
+def trampoline(fn):
+    @wraps(fn)
+    def run(*args, **kwargs):
+        pending = [fn(*args, **kwargs)]
+        result = None
+        while pending:
+            try:
+                call = pending[-1].send(result)
+            except StopIteration as finished:
+                pending.pop()
+                result = finished.value
+            else:
+                pending.append(call)
+                result = None
+        return result
+
+    run.defer = fn  # Inside the generator, `yield f.defer(...)` is the recursive call
+    return run
+
+
+def list_sum_rec(num_list):
+    total = 0
+    for num in num_list:
+        total += num
+    return total
+
+
+def reverse_str(str):
+    return str[::-1]
+
+
+def reversal_recursive(ls):
+    return ls[::-1]
+
+
+def is_pal(s):
+    return is_palindrome(s)
+
+
+def factorial_recursive(n):
+    if n <= 1:
+        return 1
+    return math.factorial(n)  # Multiplies in balanced halves, much faster than 1*2*3*... for big n
+
+
+if __name__ == "__main__":
+    @trampoline
+    def count_down(n):
+        if n == 0:
+            return 0
+        return 1 + (yield count_down.defer(n - 1))
+
+    print(list_sum_rec([1, 3, 5, 7, 9]), reverse_str("tester"), reversal_recursive([1, 2, 3, 4]))
+    print(is_pal("hannah"), factorial_recursive(10))
+    print(count_down(10**5))  # Way past the recursion limit